@@ -1,11 +1,47 @@
 import streamlit as st
-import pandas as pd
-from core.utils import load_file, display_report, display_recommendations, get_categorical_columns, get_numeric_columns
+import numpy as np
+from core.utils import (load_uploaded_file, display_report, display_recommendations, get_categorical_columns,
+                        get_numeric_columns, to_csv_bytes, to_excel_bytes, to_parquet_bytes)
 from core.analyzer import DataAnalyzer
 from core.visualizer import DataVisualizer
 from core.cleaner import DataCleaner
 from core.recommender import RecommendationEngine
-import io
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_plot(_visualizer, file_id, df_version, plot_name, col=None, subset=None):
+    """
+    Render a visualizer plot to PNG bytes, or None if there is nothing to plot.
+
+    Cached per uploaded file, df_version and plot arguments, so regenerating an
+    unchanged plot skips matplotlib entirely. The visualizer itself is not hashed.
+    """
+    if plot_name == 'correlation':
+        buffer = _visualizer.plot_correlation_heatmap()
+    elif plot_name == 'missing':
+        buffer = _visualizer.plot_missing_heatmap()
+    elif plot_name == 'value_counts':
+        buffer = _visualizer.plot_value_counts(col)
+    elif plot_name == 'outliers':
+        buffer = _visualizer.plot_outliers(col)
+    else:  # pairplot
+        buffer = _visualizer.pairplot_numeric(subset=list(subset))
+    return buffer.getvalue() if buffer is not None else None
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def export_bytes(_df, file_id, df_version, file_format):
+    """
+    Serialize the cleaned DataFrame for download.
+
+    Cached per uploaded file, df_version and format, so tab switches and other
+    reruns don't re-serialize an unchanged frame. The DataFrame itself is not hashed.
+    """
+    if file_format == "CSV":
+        return to_csv_bytes(_df)
+    elif file_format == "Excel":
+        return to_excel_bytes(_df, sheet_name='CleanedData')
+    return to_parquet_bytes(_df)
 
 
 st.set_page_config("Data Cleaning Assistance")
@@ -16,20 +52,14 @@ uploaded_file = st.sidebar.file_uploader(label="Upload csv or excel file", type=
 # --- After file upload ---
 if uploaded_file is not None:
     if 'cleaner' not in st.session_state:
-        df = load_file(uploaded_file)
+        df = load_uploaded_file(uploaded_file.name, uploaded_file.getvalue())
         st.session_state.cleaner = DataCleaner(df)
+        st.session_state.df_version = 0
     cleaner = st.session_state.cleaner
-    # Initialize DataVisualizer once
-    if 'visualizer' not in st.session_state:
-        st.session_state.visualizer = DataVisualizer(st.session_state.cleaner.df)
-    else:
-        st.session_state.visualizer.df = st.session_state.cleaner.df  # keep updated
 
-    # Initialize DataAnalyzer once
-    if 'analyzer' not in st.session_state:
-        st.session_state.analyzer = DataAnalyzer(st.session_state.cleaner.df)
-    else:
-        st.session_state.analyzer.df = st.session_state.cleaner.df  # keep updated
+    # Column lists are computed once per rerun and shared by every widget below.
+    numeric_cols = get_numeric_columns(cleaner.df)
+    categorical_cols = get_categorical_columns(cleaner.df)
 
     # --- Sidebar cleaning operations ---
     st.sidebar.header("Data Cleaning Operations")
@@ -51,6 +81,7 @@ if uploaded_file is not None:
     if st.sidebar.button("Apply Missing Value Fix", key='fill missing'):
         try:
             cleaner.handle_missing(selected_column, selected_strategy, fill_value=fill_value)
+            st.session_state.df_version += 1
             st.success(f"Applied {selected_strategy} strategy to '{selected_column}' successfully.")
             # --- Show updated dataframe after cleaning ---
             with st.expander("Updated Data Preview"):
@@ -64,6 +95,7 @@ if uploaded_file is not None:
         try:
             before = len(st.session_state.cleaner.df)
             st.session_state.cleaner.remove_duplicates()
+            st.session_state.df_version += 1
             after = len(st.session_state.cleaner.df)
             removed = before - after
             st.success(f"{removed} duplicate rows removed successfully!")
@@ -73,9 +105,6 @@ if uploaded_file is not None:
     # --- Outlier Removal ---
     st.sidebar.markdown("### Handle Outliers")
 
-    # Get numeric columns only
-    numeric_cols = get_numeric_columns(cleaner.df)
-
     if not numeric_cols:
         st.sidebar.warning("No numeric columns available for outlier handling.")
     else:
@@ -88,6 +117,7 @@ if uploaded_file is not None:
             try:
                 before = len(st.session_state.cleaner.df)
                 st.session_state.cleaner.remove_outliers(selected_outlier_col, selected_method)
+                st.session_state.df_version += 1
                 after = len(st.session_state.cleaner.df)
                 removed = before - after
                 st.success(
@@ -98,14 +128,12 @@ if uploaded_file is not None:
         # --- Encoding Section ---
         st.sidebar.markdown("### Encode Categoricals")
 
-        categorical_columns = get_categorical_columns(st.session_state.cleaner.df)
-
-        if not categorical_columns:
+        if not categorical_cols:
             st.sidebar.info("No categorical columns available for encoding.")
         else:
             selected_encoding_col = st.sidebar.selectbox(
                 "Select column to encode",
-                categorical_columns,
+                categorical_cols,
                 key="encode_col_select"
             )
 
@@ -119,6 +147,7 @@ if uploaded_file is not None:
                 try:
                     before_cols = len(st.session_state.cleaner.df.columns)
                     cleaner.encode_categoricals(selected_encoding_col, selected_encoding_method)
+                    st.session_state.df_version += 1
                     after_cols = len(st.session_state.cleaner.df.columns)
                     added_cols = after_cols - before_cols
 
@@ -129,21 +158,23 @@ if uploaded_file is not None:
                         st.success(
                             f"{selected_encoding_col} encoded successfully using One-Hot Encoding — {added_cols} new columns added.")
                     with st.expander("Preview Encoded Data (sample 5 rows)"):
-                        st.dataframe(st.session_state.cleaner.df.sample(5))
+                        encoded_df = st.session_state.cleaner.df
+                        # Fixed seed keeps the preview stable across reruns; no full-frame shuffle.
+                        rows = np.random.default_rng(0).choice(len(encoded_df), size=min(5, len(encoded_df)),
+                                                               replace=False)
+                        st.dataframe(encoded_df.iloc[np.sort(rows)])
                 except Exception as e:
                     st.error(f"Error while encoding '{selected_encoding_col}': {str(e)}")
 
         # --- Scaling Section ---
         st.sidebar.markdown("### Scale Numeric Features")
 
-        numeric_columns = get_numeric_columns(st.session_state.cleaner.df)
-
-        if not numeric_columns:
+        if not numeric_cols:
             st.sidebar.info("No numeric columns available for scaling.")
         else:
             selected_numeric_cols = st.sidebar.multiselect(
                 "Select columns to scale",
-                numeric_columns,
+                numeric_cols,
                 key="scale_cols_multiselect"
             )
 
@@ -157,6 +188,7 @@ if uploaded_file is not None:
                 try:
                     if selected_numeric_cols:
                         cleaner.scale_features(selected_numeric_cols, selected_scaler)
+                        st.session_state.df_version += 1
                         st.success(f"Columns {selected_numeric_cols} scaled successfully using {selected_scaler}.")
 
                         with st.expander("Preview Scaled Data (describe)"):
@@ -177,12 +209,33 @@ if uploaded_file is not None:
     st.subheader("Current Data Preview")
     st.dataframe(cleaner.df.head())
 
-    # --- Generate and show full analysis report ---
-    report = st.session_state.analyzer.generate_report()
+    # Synced after the sidebar operations, which may have replaced cleaner.df.
+    # Initialize DataVisualizer once
+    if 'visualizer' not in st.session_state:
+        st.session_state.visualizer = DataVisualizer(st.session_state.cleaner.df, st.session_state.df_version)
+    else:
+        # keep updated; cached plot inputs survive reruns that didn't change the data
+        st.session_state.visualizer.rebind(st.session_state.cleaner.df, st.session_state.df_version)
+
+    # Initialize DataAnalyzer once
+    if 'analyzer' not in st.session_state:
+        st.session_state.analyzer = DataAnalyzer(st.session_state.cleaner.df)
+    else:
+        st.session_state.analyzer.df = st.session_state.cleaner.df  # keep updated
 
-    # --- Generate and show recommendations ---
-    re = RecommendationEngine(report)
-    suggestions = re.generate_suggestions()
+    # --- Generate full analysis report and recommendations ---
+    # Both are rebuilt only when a cleaning operation has bumped df_version since the last report.
+    if st.session_state.get('report_version') != st.session_state.df_version:
+        st.session_state.analyzer.df_version = st.session_state.df_version
+        st.session_state.report = st.session_state.analyzer.generate_report()
+        st.session_state.suggestions = RecommendationEngine(st.session_state.report).generate_suggestions()
+        st.session_state.report_version = st.session_state.df_version
+    report = st.session_state.report
+    suggestions = st.session_state.suggestions
+
+    # Refresh column lists in case a cleaning operation above changed the schema.
+    numeric_cols = get_numeric_columns(cleaner.df)
+    categorical_cols = get_categorical_columns(cleaner.df)
 
     ## Tabs for tasks
     report_tab, visualize_tab, download_tab = st.tabs(["Analysis Report", "Visualize Data", "Download Cleaned Data"])
@@ -191,6 +244,12 @@ if uploaded_file is not None:
         # report
         display_report(report)
 
+        # The report estimates object-column memory; the exact figure is opt-in.
+        if st.button("Compute Accurate Memory Usage", key='accurate_memory'):
+            st.session_state.analyzer.df_version = st.session_state.df_version
+            exact_memory = st.session_state.analyzer.basic_info(accurate=True)['memory']
+            st.info(f"Exact memory usage: {exact_memory}")
+
         # suggestions
         display_recommendations(suggestions)
         # data preview
@@ -203,44 +262,47 @@ if uploaded_file is not None:
 
         if selected_plot == 'Correlation Heatmap':
             if st.button("Generate Heatmap", key='heatmap'):
-                visualizer.plot_correlation_heatmap(file_path='temp.png')
-                st.image("temp.png", use_container_width=True)
+                image = render_plot(visualizer, uploaded_file.file_id, st.session_state.df_version, 'correlation')
+                if image is None:
+                    st.warning("Need at least two numeric columns to plot a correlation heatmap.")
+                else:
+                    st.image(image, use_container_width=True)
         elif selected_plot == 'Missing Value Heatmap':
             if st.button("Generate Missing Values Heatmap"):
-                visualizer.plot_missing_heatmap(file_path='temp.png')
-                st.image("temp.png", use_container_width=True)
+                image = render_plot(visualizer, uploaded_file.file_id, st.session_state.df_version, 'missing')
+                st.image(image, use_container_width=True)
         elif selected_plot == 'Value Counts':
-            cat_cols = get_categorical_columns(st.session_state.cleaner.df)
-            selected_col = st.selectbox("select column to plot", cat_cols, key='column_selection')
+            selected_col = st.selectbox("select column to plot", categorical_cols, key='column_selection')
             if st.button("Generate Countplot"):
-                visualizer.plot_value_counts(selected_col, file_path='temp.png')
-                st.image('temp.png', use_container_width=True)
+                image = render_plot(visualizer, uploaded_file.file_id, st.session_state.df_version, 'value_counts',
+                                    col=selected_col)
+                st.image(image, use_container_width=True)
         elif selected_plot == 'plot outliers':
-            numeric_cols = get_numeric_columns(st.session_state.cleaner.df)
             selected_col = st.selectbox("select column to plot", numeric_cols, key='numeric_column_selection')
             if st.button("Generate BoxPlot"):
-                visualizer.plot_outliers(selected_col, file_path='temp.png')
-                st.image('temp.png', use_container_width=True)
+                image = render_plot(visualizer, uploaded_file.file_id, st.session_state.df_version, 'outliers',
+                                    col=selected_col)
+                st.image(image, use_container_width=True)
         elif selected_plot == 'pairplot':
-            numeric_cols = get_numeric_columns(st.session_state.cleaner.df)
             subset = st.multiselect("select columns for pairplot", numeric_cols, key='cols_for_pairplot', default=numeric_cols[0:2])
             if len(subset) < 2:
                 st.error("Please select at least two columns to create a pairplot.")
             else:
                 if st.button("Generate Pairplot"):
-                    visualizer.pairplot_numeric(file_path='temp.png', subset=subset)
-                    st.image('temp.png', use_container_width=True)
+                    image = render_plot(visualizer, uploaded_file.file_id, st.session_state.df_version, 'pairplot',
+                                        subset=tuple(subset))
+                    st.image(image, use_container_width=True)
         else:
             print("Select from available plots.")
 
     with download_tab:
         st.subheader("Download Cleaned Data")
 
-        file_format = st.selectbox("Choose file format", ["CSV", "Excel"])
+        file_format = st.selectbox("Choose file format", ["CSV", "Excel", "Parquet"])
 
         if file_format == "CSV":
             # Create CSV data in memory
-            csv_data = st.session_state.cleaner.df.to_csv(index=False).encode('utf-8')
+            csv_data = export_bytes(st.session_state.cleaner.df, uploaded_file.file_id, st.session_state.df_version, "CSV")
 
             # Download button for CSV
             st.download_button(
@@ -252,10 +314,7 @@ if uploaded_file is not None:
 
         elif file_format == "Excel":
             # Create Excel data in memory
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                st.session_state.cleaner.df.to_excel(writer, index=False, sheet_name='CleanedData')
-            excel_data = output.getvalue()
+            excel_data = export_bytes(st.session_state.cleaner.df, uploaded_file.file_id, st.session_state.df_version, "Excel")
 
             # Download button for Excel
             st.download_button(
@@ -265,3 +324,15 @@ if uploaded_file is not None:
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
 
+        elif file_format == "Parquet":
+            # Columnar, compressed and much faster to write than Excel for large frames
+            parquet_data = export_bytes(st.session_state.cleaner.df, uploaded_file.file_id, st.session_state.df_version,
+                                        "Parquet")
+
+            # Download button for Parquet
+            st.download_button(
+                label="Download Cleaned Parquet",
+                data=parquet_data,
+                file_name="cleaned_data.parquet",
+                mime="application/vnd.apache.parquet"
+            )
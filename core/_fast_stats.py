@@ -0,0 +1,217 @@
+"""
+Numeric kernels shared by the analyzer and visualizer.
+
+Numba is an optional dependency: when it is not installed, NUMBA_AVAILABLE is False
+and callers fall back to the equivalent pandas reductions. It is only imported, and
+the kernel compiled, on the first numeric_moments call, so importing this module
+stays cheap.
+"""
+import importlib.util
+import warnings
+import numpy as np
+import pandas as pd
+
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+try:
+    import cupy
+except ImportError:  # CuPy is optional; correlation stays on the CPU
+    cupy = None
+
+# Below this many cells the host-device transfer outweighs the GPU speedup.
+GPU_MIN_SIZE = 5_000_000
+
+
+# 'nnan'/'ninf' are left out of fastmath on purpose: the kernel relies on NaN checks.
+_FASTMATH_FLAGS = {'reassoc', 'contract', 'nsz', 'arcp'}
+
+
+def _column_moments(arr, out):
+    """
+    Per-column mean, std, skew and kurtosis of a 2D float64 array, ignoring NaNs.
+
+    Results are written to `out` (shape (4, n_cols)) and match pandas' sample
+    estimators: std with ddof=1, bias-adjusted skew and excess kurtosis, including
+    pandas' zeroing of floating point noise below 1e-14 in nanskew/nankurt.
+    """
+    n_rows, n_cols = arr.shape
+    for j in range(n_cols):
+        count = 0
+        total = 0.0
+        for i in range(n_rows):
+            x = arr[i, j]
+            if not np.isnan(x):
+                count += 1
+                total += x
+
+        if count == 0:
+            out[0, j] = np.nan
+            out[1, j] = np.nan
+            out[2, j] = np.nan
+            out[3, j] = np.nan
+            continue
+
+        mean = total / count
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        for i in range(n_rows):
+            x = arr[i, j]
+            if not np.isnan(x):
+                d = x - mean
+                d2 = d * d
+                m2 += d2
+                m3 += d2 * d
+                m4 += d2 * d2
+
+        out[0, j] = mean
+        out[1, j] = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+        # Same floating point error guards as pandas' nanskew: m2 and m3 are zeroed
+        # independently, and a zero m2 means zero skew.
+        skew_m2 = 0.0 if abs(m2) < 1e-14 else m2
+        skew_m3 = 0.0 if abs(m3) < 1e-14 else m3
+        if count < 3:
+            out[2, j] = np.nan
+        elif skew_m2 == 0.0:
+            out[2, j] = 0.0
+        else:
+            out[2, j] = (count * (count - 1) ** 0.5 / (count - 2)) * (skew_m3 / skew_m2 ** 1.5)
+
+        # ... and nankurt: zero-out numerator and denominator, zero denominator means zero kurtosis.
+        if count < 4:
+            out[3, j] = np.nan
+        else:
+            numerator = count * (count + 1) * (count - 1) * m4
+            denominator = (count - 2) * (count - 3) * m2 ** 2
+            if abs(numerator) < 1e-14:
+                numerator = 0.0
+            if abs(denominator) < 1e-14:
+                out[3, j] = 0.0
+            else:
+                adj = 3.0 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+                out[3, j] = numerator / denominator - adj
+
+
+_compiled_moments = None
+
+
+def _moments_kernel():
+    """
+    _column_moments compiled with numba, built on first use.
+
+    Compiled serially on purpose: parallel=True selects numba's TBB threading layer,
+    which hangs interpreter exit when the kernel first runs off the main thread (as
+    Streamlit runs scripts), and the workqueue layer is not safe for concurrent calls.
+    """
+    global _compiled_moments
+    if _compiled_moments is None:
+        from numba import njit
+        _compiled_moments = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_column_moments)
+    return _compiled_moments
+
+
+def numeric_moments(arr):
+    """
+    Summary statistics for every column of a 2D float64 array in one compiled pass.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        2D float64 array, one column per feature. NaNs are skipped.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (5, n_cols) with rows mean, median, std, skew, kurtosis.
+    """
+    arr = np.asfortranarray(arr, dtype=np.float64)
+    moments = np.empty((4, arr.shape[1]), dtype=np.float64)
+    kernel = _moments_kernel() if NUMBA_AVAILABLE else _column_moments
+    kernel(arr, moments)
+
+    # The median needs a partition, not a running sum, so it stays in NumPy.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median = np.nanmedian(arr, axis=0) if arr.shape[0] else np.full(arr.shape[1], np.nan)
+
+    return np.vstack([moments[0], median, moments[1], moments[2], moments[3]])
+
+
+def correlation(data, use_gpu=False):
+    """
+    Pearson correlation matrix, equivalent to data.corr(numeric_only=True).
+
+    NaN-free frames of plain numpy dtypes go through a single BLAS call (see
+    _blas_correlation), or through CuPy on a CUDA device when use_gpu is set and
+    the frame has at least GPU_MIN_SIZE cells. Frames with NaNs need
+    pairwise-complete handling, which only pandas implements, so they and
+    extension dtypes use DataFrame.corr.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Columns to correlate.
+    use_gpu : bool, optional
+        Allow the CuPy path, by default False. Ignored when CuPy is not installed
+        or no device is usable.
+
+    Returns
+    -------
+    pd.DataFrame
+        Square correlation matrix labelled by the numeric columns.
+    """
+    plain_dtypes = all(isinstance(dt, np.dtype) and dt.kind in 'biuf' for dt in data.dtypes)
+
+    if plain_dtypes and len(data) > 1 and data.shape[1]:
+        arr = data.to_numpy(dtype=np.float64, copy=True)
+        if not np.isnan(arr).any():
+            if use_gpu and cupy is not None and arr.size >= GPU_MIN_SIZE:
+                corr = _gpu_correlation(arr)
+                if corr is not None:
+                    return pd.DataFrame(corr, index=data.columns, columns=data.columns)
+            return _blas_correlation(arr, data.columns)
+
+    return data.corr(numeric_only=True)
+
+
+def _blas_correlation(arr, columns):
+    """
+    Pearson correlation of a NaN-free 2D array via one BLAS call.
+
+    Columns are standardized in float64, so large offsets don't lose precision. The
+    product X.T @ X then runs as a float32 SYRK, which computes only the upper triangle
+    (half the FLOPs of a GEMM), and is mirrored afterwards. Constant columns yield NaN,
+    as in DataFrame.corr.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        arr -= arr.mean(axis=0)
+        std = arr.std(axis=0, ddof=1)
+        arr /= std
+
+    from scipy.linalg.blas import ssyrk
+
+    standardized = np.asfortranarray(arr, dtype=np.float32)
+    upper = ssyrk(1.0 / (arr.shape[0] - 1), standardized, trans=1, lower=0).astype(np.float64)
+    corr = upper + np.triu(upper, k=1).T
+
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+    return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+def _gpu_correlation(arr):
+    """
+    Pearson correlation of a NaN-free 2D array with cupy.corrcoef in float32.
+
+    Returns None if the device cannot be used (no driver, out of memory, ...),
+    so the caller can fall back to the CPU path.
+    """
+    try:
+        corr = cupy.corrcoef(cupy.asarray(arr, dtype=cupy.float32), rowvar=False).get().astype(np.float64)
+    except Exception:
+        return None
+
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(np.isnan(np.diag(corr)), np.nan, 1.0))
+    return corr
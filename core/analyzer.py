@@ -1,26 +1,85 @@
+import sys
+import weakref
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
+import streamlit as st
 from core.utils import get_numeric_columns, get_categorical_columns
 from core.cleaner import BaseValidator
+from core._fast_stats import NUMBA_AVAILABLE, numeric_moments, correlation
+
+# Object values sampled per column when estimating memory usage.
+MEMORY_SAMPLE_SIZE = 1000
+
+# Reports kept per DataAnalyzer instance.
+REPORT_CACHE_SIZE = 4
+
+# Frames up to this many rows re-check hashed duplicate counts with df.duplicated().
+EXACT_DUPLICATE_CHECK_ROWS = 100_000
 
 class DataAnalyzer(BaseValidator):
-    def __init__(self, df):
+    def __init__(self, df, df_version=0):
         self.df = df
-
-    def basic_info(self):
+        # Bumped by callers whenever self.df is mutated, so cached reports are invalidated.
+        self.df_version = df_version
+        # (weakref to df, df_version, exact deep memory usage in bytes).
+        self._mem_cache = None
+        # DataFrame fingerprint -> (weakref to df, report), most recently used last.
+        self._cache = OrderedDict()
+
+    def basic_info(self, accurate=False):
         """
         Returns a summary of the DataFrame including shape, column dtypes, and memory usage in MB.
 
+        By default the memory of object columns is extrapolated from a sample of
+        MEMORY_SAMPLE_SIZE values (reported with a leading '~'). Pass accurate=True for
+        the exact memory_usage(deep=True) figure, which is cached per df_version.
+
         Returns:
             dict: {"shape": tuple, "dtypes": dict, "memory": str}
         """
         self._validate_dataframe()
 
+        if accurate:
+            # A weakref, not id(): ids of collected frames are reused by new ones.
+            cached = self._mem_cache
+            if cached is None or cached[0]() is not self.df or cached[1] != self.df_version:
+                exact = self.df.memory_usage(deep=True).sum()
+                cached = self._mem_cache = (weakref.ref(self.df), self.df_version, exact)
+            memory = f"{cached[2] / (1024 ** 2):.2f} MB"
+        else:
+            memory = f"~{self._estimate_memory() / (1024 ** 2):.2f} MB"
+
         return {
             "shape": self.df.shape,
             "dtypes": self.df.dtypes.apply(str).to_dict(),
-            "memory": f"{self.df.memory_usage(deep=True).sum() / (1024 ** 2):.2f} MB"
+            "memory": memory
         }
 
+    def _estimate_memory(self):
+        """
+        Approximate deep memory usage in bytes.
+
+        Uses the shallow memory_usage, plus a per-object size extrapolated from an
+        evenly spaced sample of each object (or Python-backed string) column. This
+        avoids calling sys.getsizeof on every element. Category columns add the deep
+        size of their categories, which holds one entry per distinct value.
+        """
+        total = self.df.memory_usage(deep=False).sum()
+        n_rows = len(self.df)
+
+        for _, values in self.df.items():
+            dtype = values.dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                categories = dtype.categories
+                total += categories.memory_usage(deep=True) - categories.memory_usage(deep=False)
+            elif n_rows and (dtype == object or isinstance(dtype, pd.StringDtype) and dtype.storage == 'python'):
+                sample_idx = np.linspace(0, n_rows - 1, num=min(MEMORY_SAMPLE_SIZE, n_rows), dtype=np.int64)
+                sample = values.to_numpy(dtype=object)[sample_idx]
+                total += np.mean([sys.getsizeof(v) for v in sample]) * n_rows
+
+        return int(total)
+
     def missing_summary(self):
         """
         Returns a summary of missing values in each column.
@@ -34,7 +93,12 @@ class DataAnalyzer(BaseValidator):
         """
         self._validate_dataframe()
 
-        total_count = self.df.isnull().sum()
+        # Count per column instead of materialising an N x C boolean mask first.
+        total_count = pd.Series(
+            [_missing_count(values) for _, values in self.df.items()],
+            index=self.df.columns,
+            dtype='int64'
+        )
         percent_count = (total_count / self.df.shape[0] * 100).round(2)
 
         return pd.DataFrame({
@@ -50,8 +114,22 @@ class DataAnalyzer(BaseValidator):
             dict: {'duplicate_rows': int}
         """
         self._validate_dataframe()
-        duplicate_count = int(self.df.duplicated().sum())
-        return {'duplicate_rows': duplicate_count}
+
+        if len(self.df) <= EXACT_DUPLICATE_CHECK_ROWS:
+            return {'duplicate_rows': int(self.df.duplicated().sum())}
+
+        # Large frames: count repeated uint64 row fingerprints instead of hashing row tuples.
+        # -0.0 and 0.0 compare equal but hash differently, so floats are normalized first.
+        frame = self.df
+        float_positions = [i for i, dt in enumerate(frame.dtypes) if isinstance(dt, np.dtype) and dt.kind == 'f']
+        if float_positions:
+            frame = frame.copy(deep=False)
+            for position in float_positions:
+                frame.isetitem(position, frame.iloc[:, position].to_numpy() + 0.0)
+        row_hashes = pd.util.hash_pandas_object(frame, index=False).values
+        duplicate_count = row_hashes.size - np.unique(row_hashes).size
+
+        return {'duplicate_rows': int(duplicate_count)}
 
     def numeric_summary(self):
         """
@@ -69,15 +147,18 @@ class DataAnalyzer(BaseValidator):
 
         numeric_data = self.df[numeric_cols]
 
-        stats = {
-            'mean': numeric_data.mean(),
-            'median': numeric_data.median(),
-            'std': numeric_data.std(),
-            'skew': numeric_data.skew(),
-            'kurtosis': numeric_data.kurt()
-        }
+        if NUMBA_AVAILABLE and all(isinstance(dt, np.dtype) and dt.kind in 'iuf' for dt in numeric_data.dtypes):
+            # Compiled moments kernel over the contiguous float64 block.
+            return pd.DataFrame(
+                numeric_moments(numeric_data.to_numpy(dtype=np.float64)),
+                index=['mean', 'median', 'std', 'skew', 'kurtosis'],
+                columns=numeric_cols
+            )
+
+        # Single aggregation call instead of five separate reductions.
+        stats = numeric_data.agg(['mean', 'median', 'std', 'skew', 'kurt'])
 
-        return pd.DataFrame(stats).T
+        return stats.rename(index={'kurt': 'kurtosis'})
 
     def categorical_summary(self):
         """
@@ -92,20 +173,26 @@ class DataAnalyzer(BaseValidator):
         if not categorical_cols:
             raise ValueError("No categorical columns found in the DataFrame.")
 
-        categorical_data = self.df[categorical_cols]
         summary = {'nunique': [], 'mode': [], 'freq': []}
 
-        for col in categorical_data.columns:
-            nunique = categorical_data[col].nunique(dropna=True)
-            mode_values = categorical_data[col].mode(dropna=True)
-            top_value = mode_values.iloc[0] if not mode_values.empty else None
-            freq = categorical_data[col].value_counts(dropna=True).iloc[0] if categorical_data[col].count() > 0 else 0
+        # Columns are read straight from self.df; no categorical sub-frame is materialised.
+        for col in categorical_cols:
+            # One hash build per column: factorize, then count the integer codes.
+            # sort=True keeps ties resolved to the smallest value, like Series.mode().
+            codes, uniques = pd.factorize(self.df[col].values, sort=True)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
 
-            summary['nunique'].append(nunique)
+            if counts.size:
+                top = int(counts.argmax())
+                top_value, freq = uniques[top], int(counts[top])
+            else:
+                top_value, freq = None, 0
+
+            summary['nunique'].append(counts.size)
             summary['mode'].append(top_value)
             summary['freq'].append(freq)
 
-        return pd.DataFrame(summary, index=categorical_data.columns)
+        return pd.DataFrame(summary, index=categorical_cols)
 
     def correlation_matrix(self):
         """
@@ -120,32 +207,96 @@ class DataAnalyzer(BaseValidator):
         if not numeric_cols:
             raise ValueError("No numeric columns found to compute correlation matrix.")
 
-        return self.df[numeric_cols].corr(numeric_only=True)
+        return correlation(self.df[numeric_cols])
 
     def generate_report(self):
         """
         Generates a comprehensive analysis report of the DataFrame
         by combining outputs from all analysis methods.
 
+        Reports are memoized per DataFrame fingerprint (shape, columns, dtypes and
+        df_version) plus a weakref identity check, so bump df_version after mutating
+        self.df in place.
+
         Returns:
             dict: complete report with all summaries (safe even if some fail)
         """
         self._validate_dataframe()
 
-        report = {}
-        methods = {
-            "basic_info": self.basic_info,
-            "missing_summary": lambda: self.missing_summary().to_dict(orient='index'),
-            "duplicate_summary": self.duplicate_summary,
-            "numeric_summary": lambda: self.numeric_summary().to_dict(),
-            "categorical_summary": lambda: self.categorical_summary().to_dict(orient='index'),
-            "correlation_matrix": lambda: self.correlation_matrix().to_dict()
-        }
-
-        for name, func in methods.items():
-            try:
-                report[name] = func()
-            except Exception as e:
-                report[name] = {"error": str(e)}
-
-        return report
\ No newline at end of file
+        # Cheap in-process memo ahead of the Streamlit cache, which hashes the full contents.
+        # Identity is checked through a weakref rather than keyed on id(), which a new
+        # frame can reuse once the old one is garbage collected.
+        fingerprint = (self.df.shape, hash(tuple(self.df.columns)), tuple(map(str, self.df.dtypes)), self.df_version)
+        entry = self._cache.get(fingerprint)
+        if entry is not None and entry[0]() is self.df:
+            self._cache.move_to_end(fingerprint)
+            return entry[1]
+
+        content_key = _hash_dataframe(self.df)
+        if content_key is None:
+            # Unhashable cells (lists, dicts, ...): build the report without the Streamlit cache.
+            report = _compute_report(self.df, self.df_version)
+        else:
+            report = _build_report(self.df, content_key, self.df_version)
+        self._cache[fingerprint] = (weakref.ref(self.df), report)
+        self._cache.move_to_end(fingerprint)
+        if len(self._cache) > REPORT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        return report
+
+
+def _missing_count(series):
+    """Number of missing values in a column, skipping the scan where the dtype cannot hold NaN."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in 'iub':
+            return 0
+        if dtype.kind in 'fc':
+            return int(np.isnan(series.to_numpy()).sum())
+    return int(series.isna().sum())
+
+
+def _hash_dataframe(df):
+    """
+    Content fingerprint used to key cached reports, or None if df holds unhashable
+    values (e.g. lists) that hash_pandas_object rejects.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).values.tobytes()
+    except TypeError:
+        return None
+    return (df.shape, tuple(df.columns), row_hashes)
+
+
+@st.cache_data(show_spinner=False)
+def _build_report(_df, content_key, df_version=0):
+    """
+    Cached _compute_report, keyed on the content fingerprint of _df (see
+    _hash_dataframe) and the caller's df_version, so Streamlit reruns that don't
+    touch the data skip every full-frame reduction. _df itself is not hashed.
+    """
+    return _compute_report(_df, df_version)
+
+
+def _compute_report(df, df_version=0):
+    """Builds the analysis report for a DataFrame; sections that fail hold an error entry."""
+    analyzer = DataAnalyzer(df, df_version)
+
+    report = {}
+    methods = {
+        "basic_info": analyzer.basic_info,
+        "missing_summary": lambda: analyzer.missing_summary().to_dict(orient='index'),
+        "duplicate_summary": analyzer.duplicate_summary,
+        "numeric_summary": lambda: analyzer.numeric_summary().to_dict(),
+        "categorical_summary": lambda: analyzer.categorical_summary().to_dict(orient='index'),
+        "correlation_matrix": lambda: analyzer.correlation_matrix().to_dict()
+    }
+
+    for name, func in methods.items():
+        try:
+            report[name] = func()
+        except Exception as e:
+            report[name] = {"error": str(e)}
+
+    return report
@@ -1,6 +1,15 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder, StandardScaler, MinMaxScaler, RobustScaler
+from core.dtypes import is_categorical_dtype, is_numeric_dtype
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # numexpr is optional; z-score masks fall back to NumPy
+    NUMEXPR_AVAILABLE = False
+
+# Below this many cells numexpr's setup costs more than the temporaries it saves.
+NUMEXPR_MIN_SIZE = 100_000
 
 
 class BaseValidator:
@@ -13,20 +22,37 @@ class BaseValidator:
 
     def _validate_column_exists(self, col_name):
         """Ensure the given column exists in the DataFrame."""
-        if col_name not in self.df.columns:
+        if col_name not in self._column_names():
             raise KeyError(f"Column '{col_name}' not found in the DataFrame.")
 
+    def _column_names(self):
+        """
+        Frozenset of the DataFrame's column names, rebuilt only when the columns change.
+
+        Index objects are immutable and pandas swaps in a new one whenever columns are
+        added, dropped or renamed (or self.df is rebound), so identity is a safe cache key.
+        """
+        columns = self.df.columns
+        if getattr(self, '_column_set_source', None) is not columns:
+            self._column_set_source = columns
+            self._column_set = frozenset(columns)
+        return self._column_set
+
     def _validate_numeric_column(self, col_name):
-        """Ensure the given column is numeric."""
+        """Ensure the given column is numeric. Returns the column so callers can reuse it."""
         self._validate_column_exists(col_name)
-        if not pd.api.types.is_numeric_dtype(self.df[col_name]):
+        column = self.df[col_name]
+        if not is_numeric_dtype(column.dtype):
             raise TypeError(f"Column '{col_name}' must be numeric for this operation.")
+        return column
 
     def _validate_categorical_column(self, col_name):
-        """Ensure the given column is categorical."""
+        """Ensure the given column is categorical. Returns the column so callers can reuse it."""
         self._validate_column_exists(col_name)
-        if self.df[col_name].dtype not in ['object', 'category']:
+        column = self.df[col_name]
+        if not is_categorical_dtype(column.dtype):
             raise TypeError(f"Column '{col_name}' is not categorical. Operation only applies to categorical columns.")
+        return column
 
     def _validate_plot_type(self, plot_type, allowed_types):
         if plot_type not in allowed_types:
@@ -37,13 +63,24 @@ class BaseValidator:
             raise ValueError("diag_kind must be either 'hist' or 'kde'.")
 
     def _validate_numeric_dataframe(self, df):
-        if not all(pd.api.types.is_numeric_dtype(df[col]) for col in df.columns):
+        if not all(is_numeric_dtype(dtype) for dtype in df.dtypes):
             raise TypeError("All columns in the DataFrame must be numeric for this operation.")
 
 
 class DataCleaner(BaseValidator):
-    def __init__(self, df):
-        self.df = df.copy()
+    def __init__(self, df, copy=True, float_dtype=None):
+        """
+        Parameters:
+            df (pd.DataFrame): Data to clean.
+            copy (bool): Deep-copy df first (default). Pass False only when the caller
+                owns df privately; cleaning operations rebind self.df to new frames
+                but column fills still write into the shared object.
+            float_dtype (str, optional): e.g. 'float32'. Cast columns to this dtype
+                before scaling, halving memory traffic; scaled columns keep it.
+                Default None scales in float64.
+        """
+        self.df = df.copy(deep=True) if copy else df
+        self.float_dtype = float_dtype
 
     def handle_missing(self, col_name, strategy, fill_value=None):
         """
@@ -57,42 +94,107 @@ class DataCleaner(BaseValidator):
         Returns:
             self: Enables method chaining.
         """
+        return self.handle_missing_bulk({col_name: (strategy, fill_value)})
+
+    def handle_missing_bulk(self, spec):
+        """
+        Handles missing values in several columns at once.
+
+        Statistics are computed with one reduction per strategy (e.g. a single
+        df[mean_cols].mean()) rather than one pass per column. 'drop' rules are
+        applied first, so fill statistics are computed on the remaining rows.
+        Columns without missing values are skipped.
+
+        Parameters:
+            spec (dict): {col_name: strategy} or {col_name: (strategy, fill_value)},
+                with strategy one of ['mean', 'median', 'mode', 'constant', 'drop'].
+
+        Returns:
+            self: Enables method chaining.
+        """
+        valid_strategies = ['mean', 'median', 'mode', 'constant', 'drop']
+        plan = {strategy: [] for strategy in valid_strategies}
+        constants = {}
 
+        col_name = None
         try:
             self._validate_dataframe()
-            self._validate_column_exists(col_name)
-
-            valid_strategies = ['mean', 'median', 'mode', 'constant', 'drop']
-            if strategy not in valid_strategies:
-                raise ValueError(f"Invalid strategy '{strategy}'. Choose from {valid_strategies}.")
-
-            if strategy in ['mean', 'median']:
-                self._validate_numeric_column(col_name)
-
-            if strategy == 'mean':
-                self.df[col_name].fillna(self.df[col_name].mean(), inplace=True)
-            elif strategy == 'median':
-                self.df[col_name].fillna(self.df[col_name].median(), inplace=True)
-            elif strategy == 'mode':
-                mode_value = self.df[col_name].mode(dropna=True)
-                if not mode_value.empty:
-                    self.df[col_name].fillna(mode_value[0], inplace=True)
-            elif strategy == 'constant':
-                if fill_value is None:
-                    raise ValueError("You must provide a 'fill_value' when using the 'constant' strategy.")
-                self.df[col_name].fillna(fill_value, inplace=True)
-            elif strategy == 'drop':
-                self.df.dropna(subset=[col_name], inplace=True)
+
+            for col_name, rule in spec.items():
+                strategy, fill_value = (rule, None) if isinstance(rule, str) else rule
+                self._validate_column_exists(col_name)
+
+                if strategy not in valid_strategies:
+                    raise ValueError(f"Invalid strategy '{strategy}'. Choose from {valid_strategies}.")
+
+                if strategy in ['mean', 'median']:
+                    self._validate_numeric_column(col_name)
+
+                if strategy == 'constant':
+                    if fill_value is None:
+                        raise ValueError("You must provide a 'fill_value' when using the 'constant' strategy.")
+                    constants[col_name] = fill_value
+
+                plan[strategy].append(col_name)
+
+            col_name = ', '.join(map(str, spec))
+
+            # Nothing to impute or drop in columns without NaNs.
+            plan = {strategy: [col for col in cols if self._has_missing(col)] for strategy, cols in plan.items()}
+            if not any(plan.values()):
+                return self
+
+            if plan['drop']:
+                self.df = self.df.dropna(subset=plan['drop'])
+
+            if plan['mean']:
+                self._fill_numeric(self.df[plan['mean']].mean())
+            if plan['median']:
+                self._fill_numeric(self.df[plan['median']].median())
+            if plan['mode']:
+                modes = self.df[plan['mode']].mode(dropna=True)
+                if not modes.empty:
+                    # Columns that are entirely NaN have no mode and stay untouched.
+                    self._fill_values(modes.iloc[0].dropna().to_dict())
+            if plan['constant']:
+                self._fill_values({col: constants[col] for col in plan['constant']})
 
             return self
 
         except Exception as e:
             raise RuntimeError(f"Error handling missing values for '{col_name}': {str(e)}")
 
+    def _has_missing(self, col_name):
+        """True if the column has any NaN; plain int and bool columns cannot hold one and skip the scan."""
+        column = self.df[col_name]
+        dtype = column.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iub':
+            return False
+        return bool(column.isna().any())
+
+    def _fill_numeric(self, fills):
+        """Fill NaNs with per-column statistics; plain float columns go through np.where."""
+        for col_name, fill in fills.items():
+            column = self.df[col_name]
+            dtype = column.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                arr = column.to_numpy()
+                self.df[col_name] = np.where(np.isnan(arr), dtype.type(fill), arr)
+            else:
+                self.df[col_name] = column.fillna(fill)
+
+    def _fill_values(self, fills):
+        """Fill NaNs with per-column values, registering new categories where needed."""
+        for col_name, fill in fills.items():
+            column = self.df[col_name]
+            if isinstance(column.dtype, pd.CategoricalDtype) and fill not in column.cat.categories:
+                column = column.cat.add_categories([fill])
+            self.df[col_name] = column.fillna(fill)
+
     def remove_duplicates(self, subset=None, keep='first'):
         try:
             self._validate_dataframe()
-            self.df.drop_duplicates(subset=subset, keep=keep, inplace=True)
+            self.df = self.df.drop_duplicates(subset=subset, keep=keep)
             return self
 
         except Exception as e:
@@ -101,45 +203,120 @@ class DataCleaner(BaseValidator):
     def remove_outliers(self, col_name, method='IQR'):
         try:
             self._validate_dataframe()
-            self._validate_column_exists(col_name)
             self._validate_numeric_column(col_name)
 
             valid_methods = ['IQR', 'z_score']
             if method not in valid_methods:
                 raise ValueError(f"Invalid method '{method}'. Choose from {valid_methods}.")
 
-            if method == 'IQR':
-                q1 = self.df[col_name].quantile(0.25)
-                q3 = self.df[col_name].quantile(0.75)
-                iqr = q3 - q1
-                lower_bound = q1 - 1.5 * iqr
-                upper_bound = q3 + 1.5 * iqr
-                self.df.drop(self.df[(self.df[col_name] < lower_bound) | (self.df[col_name] > upper_bound)].index, inplace=True)
-
-            elif method == 'z_score':
-                z_scores = (self.df[col_name] - self.df[col_name].mean()) / self.df[col_name].std()
-                abs_z = np.abs(z_scores)
-                self.df.drop(self.df[np.abs(z_scores) >= 3].index, inplace=True)
+            self.df = self.df.iloc[~self._outlier_mask([col_name], method)]
 
             return self
 
         except Exception as e:
             raise RuntimeError(f"Error removing outliers from '{col_name}': {str(e)}")
 
-    def encode_categoricals(self, col, method='LabelEncoder'):
+    def remove_outliers_bulk(self, cols, method='IQR'):
+        """
+        Removes rows that are outliers in any of the given numeric columns.
+
+        Bounds for every column are computed from the same frame in one vectorized
+        call (e.g. a single np.nanquantile(..., axis=0) for IQR), so the result
+        does not depend on column order as chained remove_outliers calls would.
+
+        Parameters:
+            cols (list): Numeric column names.
+            method (str): One of ['IQR', 'z_score'].
+
+        Returns:
+            self: Enables method chaining.
+        """
+        if isinstance(cols, str):
+            cols = [cols]
+
+        try:
+            self._validate_dataframe()
+            for col in cols:
+                self._validate_numeric_column(col)
+
+            valid_methods = ['IQR', 'z_score']
+            if method not in valid_methods:
+                raise ValueError(f"Invalid method '{method}'. Choose from {valid_methods}.")
+
+            if cols:
+                self.df = self.df.iloc[~self._outlier_mask(cols, method)]
+
+            return self
+
+        except Exception as e:
+            raise RuntimeError(f"Error removing outliers from {cols}: {str(e)}")
+
+    def _outlier_mask(self, cols, method):
+        """Boolean row mask, True where any of cols is an outlier. NaNs never count as outliers."""
+        arr = self.df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        if method == 'IQR':
+            q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            outliers = (arr < q1 - 1.5 * iqr) | (arr > q3 + 1.5 * iqr)
+        else:  # z_score
+            mean = np.nanmean(arr, axis=0)
+            std = np.nanstd(arr, axis=0, ddof=1)
+            # |x - mean| >= 3 * std avoids materialising the z-scores; zero-variance
+            # columns have no outliers (their z-scores are undefined).
+            if NUMEXPR_AVAILABLE and arr.size >= NUMEXPR_MIN_SIZE:
+                # Fuses subtract, abs and compare into one cache-blocked pass without temporaries.
+                outliers = numexpr.evaluate("abs(arr - mean) >= 3 * std")
+            else:
+                with np.errstate(invalid='ignore'):
+                    outliers = np.abs(arr - mean) >= 3 * std
+            outliers[:, ~(std > 0)] = False
+
+        return outliers.any(axis=1)
+
+    def encode_categoricals(self, col, method='LabelEncoder', sparse=False):
+        """
+        Encodes a categorical column in place of the original.
+
+        Parameters:
+            col (str): Categorical column to encode.
+            method (str): One of ['LabelEncoder', 'OneHot'].
+            sparse (bool): OneHot only. Store dummies as sparse uint8 columns, which
+                saves memory for high-cardinality columns.
+
+        Returns:
+            self: Enables method chaining.
+        """
         valid_methods = ['LabelEncoder', 'OneHot']
-        self._validate_categorical_column(col)
+        values = self._validate_categorical_column(col)
 
         if method not in valid_methods:
             raise ValueError(f"Choose from {valid_methods}")
 
         if method == 'OneHot':
-            encoded = pd.get_dummies(self.df[col], prefix=col, drop_first=True, dtype=int)
-            self.df = pd.concat([self.df.drop(columns=[col]), encoded], axis=1)
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Rows dropped earlier can leave categories that would become all-zero dummies.
+                values = values.cat.remove_unused_categories()
+            # uint8 dummies take an eighth of the memory of int64 ones.
+            encoded = pd.get_dummies(values, prefix=col, drop_first=True, dtype=np.uint8, sparse=sparse)
+            remaining = self.df.drop(columns=[col])
+            clashes = remaining.columns.intersection(encoded.columns)
+            if not clashes.empty:
+                raise ValueError(f"One-hot columns {list(clashes)} already exist in the DataFrame.")
+            # One concat builds the result in a single step; adding dummies column by column
+            # fragments the frame.
+            self.df = pd.concat([remaining, encoded], axis=1)
         else:  # LabelEncoder
-            le = LabelEncoder()
-            non_null_mask = self.df[col].notnull()
-            self.df.loc[non_null_mask, col] = le.fit_transform(self.df.loc[non_null_mask, col])
+            # sort=True numbers the observed values in sorted (or category) order, i.e. the same
+            # labels LabelEncoder assigns, straight from one factorization into an int array.
+            codes, _ = pd.factorize(values, sort=True)
+            codes = codes.astype(np.int32, copy=False)
+            missing = codes == -1
+            if missing.any():
+                # Missing values stay missing; a nullable Int32 keeps the labels integer.
+                self.df[col] = pd.arrays.IntegerArray(codes, missing)
+            else:
+                self.df[col] = codes
 
         return self
 
@@ -152,22 +329,21 @@ class DataCleaner(BaseValidator):
 
         # Validate columns
         for col in cols:
-            self._validate_column_exists(col)
             self._validate_numeric_column(col)
 
         # Validate method
         if method not in valid_methods:
             raise ValueError(f"Choose from {valid_methods}")
 
-        # Select scaler
-        scaler = {
-            'StandardScaler': StandardScaler(),
-            'MinMaxScaler': MinMaxScaler(),
-            'RobustScaler': RobustScaler()
-        }[method]
+        # Select scaler; scikit-learn (and scipy with it) is only imported when scaling.
+        from sklearn import preprocessing
+        scaler = getattr(preprocessing, method)()
 
         # Apply scaling
-        self.df[cols] = scaler.fit_transform(self.df[cols])
+        data = self.df[cols]
+        if self.float_dtype is not None:
+            data = data.to_numpy(dtype=self.float_dtype, na_value=np.nan)
+        self.df[cols] = scaler.fit_transform(data)
 
         return self
 
@@ -176,10 +352,32 @@ class DataCleaner(BaseValidator):
             print("DataFrame is empty. Nothing to drop.")
             return self
 
-        constant_cols = [col for col in self.df.columns if self.df[col].nunique(dropna=False) <= 1]
+        is_constant = np.zeros(self.df.shape[1], dtype=bool)
+        numeric = np.array([isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in self.df.dtypes])
+
+        # Compare numeric columns with their first row, one vectorized sweep per dtype, no hashing.
+        # Each group keeps its own dtype: casting int64 to float64 would merge values above 2**53.
+        groups = {}
+        for position, dtype in enumerate(self.df.dtypes):
+            if numeric[position]:
+                groups.setdefault(dtype, []).append(position)
+
+        for dtype, positions in groups.items():
+            arr = self.df.iloc[:, positions].to_numpy()
+            first = arr[0]
+            same = arr == first
+            if dtype.kind == 'f':
+                # NaN counts as a value (as with nunique(dropna=False)), so only all-NaN matches NaN.
+                same |= np.isnan(arr) & np.isnan(first)
+            is_constant[positions] = same.all(axis=0)
+
+        if not numeric.all():
+            is_constant[~numeric] = self.df.iloc[:, ~numeric].nunique(dropna=False).to_numpy() <= 1
+
+        constant_cols = self.df.columns[is_constant].tolist()
 
         if constant_cols:
-            self.df.drop(columns=constant_cols, inplace=True)
+            self.df = self.df.drop(columns=constant_cols)
             print(f"Dropped constant columns: {constant_cols}")
         else:
             print("No constant columns found.")
@@ -188,7 +386,10 @@ class DataCleaner(BaseValidator):
 
     def save_cleaned(self, file_path):
         """
-        Save the cleaned DataFrame to a CSV file.
+        Save the cleaned DataFrame to a CSV file, or to Parquet if the path ends with '.parquet'.
+
+        CSV is written with pyarrow's multithreaded writer when possible (see
+        core.utils.write_csv); Parquet uses zstd compression.
 
         Parameters
         ----------
@@ -203,8 +404,12 @@ class DataCleaner(BaseValidator):
             print("Warning: DataFrame is empty. Saving an empty file.")
 
         try:
-            self.df.to_csv(file_path, index=False)
+            if file_path.endswith('.parquet'):
+                self.df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+            else:
+                # Imported here: core.utils pulls in Streamlit, which cleaning itself never needs.
+                from core.utils import write_csv
+                write_csv(self.df, file_path)
             print(f"Cleaned dataset successfully saved to: {file_path}")
         except Exception as e:
             print(f"Error saving file '{file_path}': {e}")
-
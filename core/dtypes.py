@@ -0,0 +1,42 @@
+"""
+Dtype classification shared by the analyzer, cleaner, visualizer and utils.
+
+Depends on numpy and pandas only, so any module can import it cheaply.
+"""
+import functools
+import numpy as np
+import pandas as pd
+
+
+@functools.lru_cache(maxsize=1024)
+def dtype_kind(dtype):
+    """
+    Classify a column dtype as 'bool', 'number', 'timedelta', 'categorical' or 'other'.
+
+    Memoized per dtype object; dtypes are hashable and shared across columns, so
+    per-column checks cost a dict lookup.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'bool'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'number'
+    if isinstance(dtype, np.dtype) and dtype.kind == 'm':
+        return 'timedelta'
+    if (isinstance(dtype, np.dtype) and dtype.kind == 'O') or isinstance(dtype, pd.CategoricalDtype):
+        return 'categorical'
+    return 'other'
+
+
+def is_numeric_dtype(dtype):
+    """pd.api.types.is_numeric_dtype: numbers and booleans."""
+    return dtype_kind(dtype) in ('number', 'bool')
+
+
+def is_number_dtype(dtype):
+    """Dtypes df.select_dtypes(include='number') keeps: numbers and timedelta, not booleans."""
+    return dtype_kind(dtype) in ('number', 'timedelta')
+
+
+def is_categorical_dtype(dtype):
+    """Object and category dtypes."""
+    return dtype_kind(dtype) == 'categorical'
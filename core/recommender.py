@@ -1,3 +1,13 @@
+import numpy as np
+
+# Upper edges of the missing-percent bands: none (<= 0), minor, moderate, high (> 30).
+MISSING_PERCENT_BINS = [0, 5, 30]
+MISSING_TEMPLATES = [
+    "Column '{col}' has no missing values — no action needed.",
+    "Column '{col}' has minor missing values ({pct:.1f}%). Consider imputing with mean/median/mode.",
+    "Column '{col}' has moderate missing values ({pct:.1f}%). Consider advanced imputation (e.g., KNN, regression).",
+    "Column '{col}' has high missing values ({pct:.1f}%). Consider dropping the column or using domain-specific imputation.",
+]
 
 
 class RecommendationEngine:
@@ -29,28 +39,20 @@ class RecommendationEngine:
         categorical_summary = self.report_dict.get('categorical_summary', {})
         numeric_summary = self.report_dict.get('numeric_summary', {})
 
-        for col, stats in missing_summary.items():
-            missing_percent = stats.get('missing_percent', 0)
-
-            if 0 < missing_percent <= 5:
-                suggestions.append(
-                    f"Column '{col}' has minor missing values ({missing_percent:.1f}%). Consider imputing with mean/median/mode.")
-            elif 5 < missing_percent <= 30:
-                suggestions.append(
-                    f"Column '{col}' has moderate missing values ({missing_percent:.1f}%). Consider advanced imputation (e.g., KNN, regression).")
-            elif missing_percent > 30:
-                suggestions.append(
-                    f"Column '{col}' has high missing values ({missing_percent:.1f}%). Consider dropping the column or using domain-specific imputation.")
-            else:
-                suggestions.append(f"Column '{col}' has no missing values — no action needed.")
+        # Bucket every column's missing percent at once, then format one template per column.
+        pcts = np.array([stats.get('missing_percent', 0) for stats in missing_summary.values()], dtype=float)
+        levels = np.digitize(np.nan_to_num(pcts), MISSING_PERCENT_BINS, right=True)
+        suggestions.extend(
+            MISSING_TEMPLATES[level].format(col=col, pct=pct)
+            for col, pct, level in zip(missing_summary, pcts, levels)
+        )
 
         if duplicate_count > 0:
             suggestions.append(
                 f"Data contains {duplicate_count} duplicate rows. Consider removing them."
             )
-        for col, stats in categorical_summary.items():
-            nunique = stats.get('nunique', 0)
-
+        nuniques = [stats.get('nunique', 0) for stats in categorical_summary.values()]
+        for col, nunique in zip(categorical_summary, nuniques):
             if nunique > 50:
                 suggestions.append(
                     f"Column '{col}' has high cardinality ({nunique} unique values). Avoid OneHot encoding."
@@ -60,20 +62,32 @@ class RecommendationEngine:
                     f"Column '{col}' has only 1 unique value. Consider dropping it."
                 )
 
-        for col, stats in numeric_summary.items():
-            skew = abs(stats.get('skew', 0))
-            kurt = stats.get('kurtosis', 0)
+        # One pass over the summary dicts extracts aligned (skew, kurtosis) rows.
+        numeric_cols = list(numeric_summary)
+        moments = np.array(
+            [(stats.get('skew', 0), stats.get('kurtosis', 0)) for stats in numeric_summary.values()], dtype=float
+        ).reshape(-1, 2)
+        skews = np.abs(moments[:, 0])
+        kurts = moments[:, 1]
+
+        # Threshold tests run on whole arrays; only flagged columns are formatted.
+        high_skew = skews > 3
+        moderate_skew = (skews > 1) & ~high_skew
+        high_kurt = kurts > 3
+
+        for i in np.flatnonzero(high_skew | moderate_skew | high_kurt):
+            col, skew, kurt = numeric_cols[i], skews[i], kurts[i]
 
-            if skew > 3:
+            if high_skew[i]:
                 suggestions.append(
                     f"Column '{col}' is highly skewed (Skew: {skew:.2f}). Consider Box-Cox transformation."
                 )
-            elif skew > 1:
+            elif moderate_skew[i]:
                 suggestions.append(
                     f"Column '{col}' is moderately skewed (Skew: {skew:.2f}). Consider log or square root transformation."
                 )
 
-            if kurt > 3:
+            if high_kurt[i]:
                 suggestions.append(
                     f"Column '{col}' has high kurtosis (Kurtosis: {kurt:.2f}). Consider handling potential outliers."
                 )
@@ -2,11 +2,39 @@
 import pandas as pd
 import os
 import json
+import csv
+import datetime
 from io import BytesIO, StringIO
 import streamlit as st
 import re
-
-def load_file(file_input):
+import numpy as np
+import xlsxwriter
+from core.dtypes import is_categorical_dtype, is_number_dtype
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; reports fall back to the json module
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; CSV export falls back to pandas
+    pa = None
+
+# Object columns with fewer unique values than this fraction of rows are loaded as 'category'.
+CATEGORY_RATIO = 0.5
+
+# Recommendation categories, checked in order: the first matching pattern wins.
+_RECOMMENDATION_PATTERNS = {
+    "Missing Values": re.compile(r"missing values", re.IGNORECASE),
+    "High Cardinality": re.compile(r"cardinality", re.IGNORECASE),
+    "Skewness": re.compile(r"skew", re.IGNORECASE),
+    "Kurtosis": re.compile(r"kurtosis", re.IGNORECASE),
+}
+
+def load_file(file_input, optimize=True, chunksize=None):
     """
     Load a CSV or Excel file into a pandas DataFrame.
 
@@ -14,30 +42,47 @@ def load_file(file_input):
     ----------
     file_input : str or file-like
         File path (str) or file-like object (from Streamlit).
+    optimize : bool, optional
+        Shrink dtypes after loading (see optimize_dtypes), by default True.
+    chunksize : int, optional
+        CSV only. Stream the file in DataFrames of this many rows instead of
+        reading it whole, for files that do not fit in memory.
 
     Returns
     -------
-    pd.DataFrame or None
-        Loaded DataFrame, or None if an error occurred.
+    pd.DataFrame, iterator of pd.DataFrame, or None
+        Loaded DataFrame (an iterator of chunks when chunksize is set), or None
+        if an error occurred.
     """
     try:
+        name = file_input if isinstance(file_input, str) else getattr(file_input, "name", "")
+        if chunksize is not None:
+            if not name.endswith('.csv'):
+                print("Error: chunksize is only supported for CSV files.")
+                return None
+            if isinstance(file_input, str) and not os.path.exists(file_input):
+                print(f"Error: File '{file_input}' does not exist.")
+                return None
+            return _read_csv_chunks(file_input, chunksize, optimize)
+
         if isinstance(file_input, str):
             if not os.path.exists(file_input):
                 print(f"Error: File '{file_input}' does not exist.")
                 return None
             if file_input.endswith('.csv'):
-                return pd.read_csv(file_input)
+                df = _read_csv(file_input)
             elif file_input.endswith(('.xls', '.xlsx')):
-                return pd.read_excel(file_input)
+                df = _read_excel(file_input)
             else:
                 print("Error: Unsupported file type. Please provide CSV or Excel file.")
                 return None
+            return optimize_dtypes(df) if optimize else df
         else:
-            # file-like object
-            if hasattr(file_input, "name") and file_input.name.endswith('.csv'):
-                return pd.read_csv(file_input)
-            else:
-                return pd.read_excel(file_input)
+            # file-like object: Streamlit uploads expose getvalue(), plain file handles only read()
+            data = file_input.getvalue() if hasattr(file_input, "getvalue") else file_input.read()
+            if isinstance(data, str):  # text-mode handle
+                data = data.encode('utf-8')
+            return load_uploaded_file(name, data, optimize)
 
     except pd.errors.EmptyDataError:
         print("Error: File is empty.")
@@ -47,17 +92,189 @@ def load_file(file_input):
         return None
 
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_uploaded_file(name, data, optimize=True):
+    """
+    Parse uploaded file contents into a pandas DataFrame.
+
+    Results are memoized on (name, data), so Streamlit reruns with the same
+    upload skip parsing entirely.
+
+    Parameters
+    ----------
+    name : str
+        Original file name, used to pick the CSV or Excel parser.
+    data : bytes
+        Raw file contents.
+    optimize : bool, optional
+        Shrink dtypes after loading (see optimize_dtypes), by default True.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Loaded DataFrame, or None if an error occurred.
+    """
+    try:
+        if name.endswith('.csv'):
+            df = _read_csv(data)
+        else:
+            df = _read_excel(data)
+        return optimize_dtypes(df) if optimize else df
+
+    except pd.errors.EmptyDataError:
+        print("Error: File is empty.")
+        return None
+    except Exception as e:
+        print(f"Error loading file: {e}")
+        return None
+
+
+def _read_csv(source):
+    """
+    Read a CSV with the multithreaded pyarrow parser, falling back to pandas' C engine.
+
+    The C engine is also used whenever the pyarrow result would differ from it (see
+    _differs_from_c_engine), so the loaded data is the same either way.
+
+    Parameters
+    ----------
+    source : str or bytes
+        File path or raw file contents.
+    """
+    try:
+        df = pd.read_csv(BytesIO(source) if isinstance(source, bytes) else source, engine='pyarrow')
+    except Exception:
+        # pyarrow missing, or a file its stricter parser rejects (e.g. ragged rows).
+        df = None
+    if df is None or _differs_from_c_engine(df):
+        df = pd.read_csv(BytesIO(source) if isinstance(source, bytes) else source)
+    return df
+
+
+def _differs_from_c_engine(df):
+    """
+    True if a frame read with engine='pyarrow' may differ from the C engine's result.
+
+    pyarrow keeps duplicate header names (the C engine renames them a, a.1, ...),
+    parses dates and times (the C engine keeps strings), loads bytes that are not
+    UTF-8 as raw bytes (the C engine raises), and turns integers beyond int64 into
+    float64 (the C engine keeps uint64 where they fit).
+    """
+    if df.columns.duplicated().any():
+        return True
+    for position, dtype in enumerate(df.dtypes):
+        if not isinstance(dtype, np.dtype):
+            continue
+        values = df.iloc[:, position]
+        if dtype.kind == 'M':
+            return True
+        if dtype.kind == 'O':
+            # Arrow columns have a single type, so the first present value tells it.
+            present = values.dropna()
+            if len(present) and isinstance(present.iloc[0], (bytes, datetime.date, datetime.time)):
+                return True
+        elif dtype.kind == 'f' and len(values):
+            arr = values.to_numpy()
+            if not np.isnan(arr).any() and np.abs(arr).max() >= 2.0 ** 63:
+                return True
+    return False
+
+
+def _read_csv_chunks(source, chunksize, optimize=True):
+    """
+    Stream a CSV in chunks of `chunksize` rows.
+
+    Uses pandas' C engine, since the pyarrow engine cannot read in chunks. Each
+    chunk is optimized on its own, so downcast dtypes may differ between chunks.
+
+    Parameters
+    ----------
+    source : str or file-like
+        File path or file-like object.
+    chunksize : int
+        Number of rows per chunk.
+    optimize : bool, optional
+        Shrink dtypes of each chunk (see optimize_dtypes), by default True.
+
+    Returns
+    -------
+    iterator of pd.DataFrame
+    """
+    reader = pd.read_csv(source, chunksize=chunksize)
+    return (optimize_dtypes(chunk) for chunk in reader) if optimize else reader
+
+
+def _read_excel(source):
+    """
+    Read an Excel file with the Rust-backed calamine reader, falling back to pandas' default engine.
+
+    The fallback (openpyxl for .xlsx) already opens workbooks read-only and values-only.
+
+    Parameters
+    ----------
+    source : str or bytes
+        File path or raw file contents.
+    """
+    try:
+        return pd.read_excel(BytesIO(source) if isinstance(source, bytes) else source, engine='calamine')
+    except ImportError:
+        # python-calamine is optional.
+        return pd.read_excel(BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def optimize_dtypes(df, category_ratio=CATEGORY_RATIO):
+    """
+    Shrink column dtypes so later reductions move less memory.
+
+    - int64 columns are downcast to the smallest signed integer type that fits.
+    - float64 columns become float32 only when that round-trips every value exactly.
+    - object columns with fewer unique values than `category_ratio` * rows become 'category'.
+
+    Unsigned downcasting is skipped on purpose: subtracting from a uint column wraps around.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to optimize. Modified in place.
+    category_ratio : float, optional
+        Unique-to-rows ratio below which object columns are converted to 'category'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same DataFrame, for convenience.
+    """
+    n_rows = len(df)
+    for position in range(df.shape[1]):
+        values = df.iloc[:, position]
+        dtype = values.dtype
+
+        if not isinstance(dtype, np.dtype):
+            continue
+        if dtype.kind == 'i':
+            df.isetitem(position, pd.to_numeric(values, downcast='integer'))
+        elif dtype == np.float64:
+            arr = values.to_numpy()
+            down = arr.astype(np.float32)
+            if np.array_equal(down.astype(np.float64), arr, equal_nan=True):
+                df.isetitem(position, down)
+        elif dtype == object and n_rows and values.nunique(dropna=True) < category_ratio * n_rows:
+            df.isetitem(position, values.astype('category'))
+
+    return df
+
+
 def get_numeric_columns(df):
     """
     Return a list of numeric column names from the DataFrame.
     """
-    return df.select_dtypes(include='number').columns.tolist()
+    return [col for col, dtype in df.dtypes.items() if is_number_dtype(dtype)]
 
 def get_categorical_columns(df):
     """
     Return a list of categorical column names (object or category) from the DataFrame.
     """
-    return df.select_dtypes(include=['object', 'category']).columns.tolist()
+    return [col for col, dtype in df.dtypes.items() if is_categorical_dtype(dtype)]
 
 
 def save_json_report(report_dict, file_path):
@@ -75,8 +292,14 @@ def save_json_report(report_dict, file_path):
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        with open(file_path, 'w') as f:
-            json.dump(report_dict, f, indent=4)
+        if orjson is not None:
+            # orjson only supports 2-space indentation.
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(report_dict, default=_json_default, option=options))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(report_dict, f, indent=4, default=_json_default)
         print(f"Report saved successfully at {file_path}")
 
     except (OSError, IOError) as e:
@@ -86,6 +309,180 @@ def save_json_report(report_dict, file_path):
         print(f"Unexpected error: {e}")
 
 
+def _json_default(obj):
+    """Convert NumPy and pandas values that JSON encoders do not handle natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return obj.tolist()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_csv(df, destination):
+    """
+    Write a DataFrame as UTF-8 CSV, without the index.
+
+    Uses pyarrow's multithreaded CSV writer when its output is byte-identical to
+    DataFrame.to_csv (see _arrow_csv_table) and falls back to to_csv otherwise.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to write.
+    destination : str or binary file-like
+        Output path or buffer.
+    """
+    table = _arrow_csv_table(df) if pa is not None else None
+    if table is None:
+        df.to_csv(destination, index=False, encoding='utf-8')
+        return
+
+    # Arrow always quotes header names; csv's minimal quoting matches to_csv.
+    header = StringIO()
+    csv.writer(header, lineterminator='\n').writerow(df.columns)
+    header = header.getvalue().encode('utf-8')
+    options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, 'wb') as output:
+            output.write(header)
+            pa_csv.write_csv(table, output, options)
+    else:
+        destination.write(header)
+        pa_csv.write_csv(table, destination, options)
+
+
+def _arrow_csv_table(df):
+    """
+    Arrow table that pyarrow writes exactly as df.to_csv(index=False) would, or None.
+
+    Float and bool columns are pre-formatted with numpy's str(), as to_csv does, since
+    Arrow prints 22.0 as 22 and True as true. Arrow can only quote every string, so
+    frames with a value needing quotes (comma, quote, line break) return None, as do
+    types Arrow formats differently (datetimes, timedeltas, the string dtype's NA,
+    extension floats and bools) or cannot represent (mixed-type object columns).
+
+    Frames whose layout to_csv writes specially also return None: no columns (one
+    empty line per row), one column (a missing or empty value is written as "" so the
+    row is not a blank line), and non-string column labels (None is written as "").
+    """
+    if df.shape[1] < 2 or not all(isinstance(label, str) for label in df.columns):
+        return None
+
+    columns = {}
+    for position, dtype in enumerate(df.dtypes):
+        values = df.iloc[:, position]
+        if isinstance(dtype, np.dtype) and dtype.kind in 'fb':
+            arr = values.to_numpy()
+            text = arr.astype(str).astype(object)
+            if dtype.kind == 'f':
+                text[np.isnan(arr)] = None
+            values = text
+        elif not (isinstance(dtype, np.dtype) and dtype.kind in 'iuO'
+                  or isinstance(dtype, pd.CategoricalDtype)
+                  or pd.api.types.is_integer_dtype(dtype)):
+            return None
+        columns[str(position)] = values
+
+    try:
+        table = pa.Table.from_pandas(pd.DataFrame(columns, copy=False), preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    for column in table.columns:
+        kind = column.type
+        if pa.types.is_dictionary(kind):
+            column = pa.chunked_array([chunk.dictionary for chunk in column.chunks], kind.value_type)
+            kind = kind.value_type
+        if pa.types.is_integer(kind) or pa.types.is_null(kind):
+            continue
+        if not (pa.types.is_string(kind) or pa.types.is_large_string(kind)):
+            return None  # e.g. floats or bools inferred from object columns
+        if pa_compute.any(pa_compute.match_substring_regex(column, '[",\r\n]')).as_py():
+            return None
+    return table
+
+
+def to_csv_bytes(df):
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes (see write_csv).
+
+    Returns
+    -------
+    bytes
+        CSV contents, without the index.
+    """
+    output = BytesIO()
+    write_csv(df, output)
+    return output.getvalue()
+
+
+def to_excel_bytes(df, sheet_name='Sheet1'):
+    """
+    Serialize a DataFrame to an in-memory .xlsx file.
+
+    Rows are streamed with xlsxwriter's constant_memory mode, which flushes each
+    row as it is written instead of holding every cell in memory. Rows must be
+    written in order, which is why this bypasses DataFrame.to_excel (it emits
+    cells column by column).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to serialize.
+    sheet_name : str
+        Name of the worksheet.
+
+    Returns
+    -------
+    bytes
+        Contents of the .xlsx file.
+    """
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True
+    })
+    worksheet = workbook.add_worksheet(sheet_name)
+
+    worksheet.write_row(0, 0, [str(col) for col in df.columns])
+    # Missing values become None, which xlsxwriter leaves as empty cells.
+    values = df.astype(object).where(df.notna(), None)
+    # xlsxwriter rejects infinite numbers; write them as text, like to_excel's inf_rep='inf'.
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            column = df.iloc[:, position].to_numpy()
+            infinite = np.isinf(column)
+            if infinite.any():
+                cells = values.iloc[:, position].to_numpy(copy=True)
+                cells[infinite] = np.where(column[infinite] > 0, 'inf', '-inf')
+                values.isetitem(position, cells)
+    for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, row)
+
+    workbook.close()
+    return output.getvalue()
+
+
+def to_parquet_bytes(df):
+    """
+    Serialize a DataFrame to an in-memory Parquet file (pyarrow, zstd compression).
+
+    Returns
+    -------
+    bytes
+        Contents of the Parquet file.
+    """
+    output = BytesIO()
+    df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+    return output.getvalue()
+
+
 def display_report(report: dict):
     """
     Displays a data analysis report in Streamlit in a clear, structured, and adaptive way.
@@ -112,9 +509,7 @@ def display_report(report: dict):
 
                         # If 'dtypes' key is present → convert it to DataFrame for nice table display
                         if "dtypes" in content:
-                            dtype_df = pd.DataFrame(
-                                list(content["dtypes"].items()), columns=["Column", "Data Type"]
-                            )
+                            dtype_df = _dtypes_df(content["dtypes"])
                             st.write(f"**Shape:** {content.get('shape', 'N/A')}")
                             st.write(f"**Memory Usage:** {content.get('memory', 'N/A')}")
                             st.dataframe(dtype_df)
@@ -129,7 +524,7 @@ def display_report(report: dict):
                         "categorical_summary",
                         "correlation_matrix",
                     ]:
-                        df = pd.DataFrame(content).T  # Transpose so columns become rows
+                        df = _summary_df(content)  # Transposed so columns become rows
                         st.dataframe(df)
 
                     # 3. DUPLICATE SUMMARY
@@ -143,7 +538,7 @@ def display_report(report: dict):
                     # 4. FALLBACK: For any future sections not listed above
                     else:
                         try:
-                            st.dataframe(pd.DataFrame(content).T)
+                            st.dataframe(_summary_df(content))
                         except Exception:
                             st.write(content)
 
@@ -156,6 +551,16 @@ def display_report(report: dict):
                     st.write(content)
 
 
+def _summary_df(content):
+    """Table for a per-column report section, one row per column."""
+    return pd.DataFrame(content).T
+
+
+def _dtypes_df(dtypes):
+    """Column/Data Type table for the basic_info section."""
+    return pd.DataFrame(list(dtypes.items()), columns=["Column", "Data Type"])
+
+
 def display_recommendations(recommendations):
     """
     Display model/data cleaning recommendations in a structured, readable format.
@@ -169,23 +574,14 @@ def display_recommendations(recommendations):
         return
 
     # --- Categorize recommendations by keyword ---
-    categories = {
-        "Missing Values": [],
-        "High Cardinality": [],
-        "Skewness": [],
-        "Kurtosis": [],
-        "Other": []
-    }
+    categories = {category: [] for category in _RECOMMENDATION_PATTERNS}
+    categories["Other"] = []
 
     for rec in recommendations:
-        if re.search(r"missing values", rec, re.IGNORECASE):
-            categories["Missing Values"].append(rec)
-        elif re.search(r"cardinality", rec, re.IGNORECASE):
-            categories["High Cardinality"].append(rec)
-        elif re.search(r"skew", rec, re.IGNORECASE):
-            categories["Skewness"].append(rec)
-        elif re.search(r"kurtosis", rec, re.IGNORECASE):
-            categories["Kurtosis"].append(rec)
+        for category, pattern in _RECOMMENDATION_PATTERNS.items():
+            if pattern.search(rec):
+                categories[category].append(rec)
+                break
         else:
             categories["Other"].append(rec)
 
@@ -1,19 +1,280 @@
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import seaborn as sns
+import multiprocessing
 import os
+import re
+import warnings
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+import numpy as np
+import pandas as pd
+from PIL import Image
 from core.cleaner import BaseValidator
+from core.dtypes import is_numeric_dtype
+from core._fast_stats import correlation
+from core.utils import get_numeric_columns, get_categorical_columns
+
+# Missing-value heatmaps taller than this are binned to this many rows before drawing.
+MAX_HEATMAP_ROWS = 2000
+
+# Pillow encoder options per output format. zlib level 1 encodes several times faster
+# than matplotlib's default level 6 for a slightly larger PNG.
+SAVE_PIL_KWARGS = {
+    'png': {'compress_level': 1, 'optimize': False},
+    'jpg': {'quality': 90},
+    'jpeg': {'quality': 90},
+}
+
+# Width-to-height ratio of the missing-value image, matching the 8x5 plot figure.
+MISSING_IMAGE_ASPECT = 1.6
+
+# Characters replaced by '_' when a column name becomes part of a file name.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.-]+')
+
+# Threads encoding saved figures in the background (see DataVisualizer.flush).
+IO_WORKERS = 2
+
+
+# Plotting libraries, imported by _load_backend() on first use so that importing this
+# module (e.g. for analysis-only runs) does not pay for matplotlib, seaborn and scipy.
+# core.cleaner and core._fast_stats defer their scikit-learn, scipy and numba imports too.
+_backend_loaded = False
+matplotlib = Figure = FigureCanvasAgg = mpimg = sns = gaussian_kde = None
+
+
+def _load_backend():
+    """Import matplotlib (Agg backend), seaborn and scipy's KDE once; later calls are no-ops."""
+    global _backend_loaded, matplotlib, Figure, FigureCanvasAgg, mpimg, sns, gaussian_kde
+    if _backend_loaded:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import matplotlib.image as mpimg
+    import seaborn as sns
+    from scipy.stats import gaussian_kde
+
+    # Coarser path simplification and chunked Agg paths speed up dense line/scatter plots.
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
+    # Pay the default-font lookup and Agg canvas setup here rather than in the first plot.
+    matplotlib.font_manager.findfont(matplotlib.font_manager.FontProperties())
+    _new_figure(figsize=(8, 5)).canvas.draw()
+    _backend_loaded = True
+
+
+def _new_figure(figsize):
+    """
+    A Figure on its own Agg canvas.
+
+    Unlike plt.figure(), this is not registered with pyplot, so it is garbage collected
+    with its last reference instead of staying open until plt.close().
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _write_image(file_path, rgba, image_format, dpi):
+    """Encode a rendered RGBA array to file_path with Pillow."""
+    image = Image.fromarray(rgba, mode='RGBA')
+    if image_format in ('jpg', 'jpeg'):
+        image = image.convert('RGB')
+    image.save(file_path, dpi=(dpi, dpi), **SAVE_PIL_KWARGS[image_format])
+
+def _boxplot(ax, values, color=None):
+    """Horizontal matplotlib boxplot of a 1-D float array, ignoring NaN."""
+    ax.boxplot(
+        values[~np.isnan(values)], orientation='horizontal', widths=0.6,
+        patch_artist=True, boxprops={'facecolor': color or 'C0'},
+        medianprops={'color': 'black'}, flierprops={'marker': 'd', 'markerfacecolor': 'black', 'markersize': 5},
+    )
+    ax.set_yticks([])
+
+
+def _save_outlier_plot(title, values, file_path, dpi):
+    """Process-pool worker for DataVisualizer.plot_outliers_all: draw and save one boxplot."""
+    _load_backend()
+    fig = _new_figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+    _boxplot(ax, values, color='skyblue')
+    ax.set_title(title)
+    fig.tight_layout()
+    image_format = os.path.splitext(file_path)[1].lstrip('.').lower() or 'png'
+    fig.savefig(file_path, dpi=dpi, **DataVisualizer._save_kwargs(image_format))
+    return file_path
+
+
+def _draw_heatmap(viz, title, data=None, annot=False, cbar=True, yticklabels=True, **_):
+    if data is None or data.empty:
+        raise ValueError("Data must not be empty for a heatmap.")
+    viz._validate_numeric_dataframe(data)
+    fig = viz._reusable_figure()
+    ax = fig.add_subplot()
+    sns.heatmap(data, annot=annot, cbar=cbar, yticklabels=yticklabels, ax=ax)
+    ax.set_title(title)
+    return fig
+
+
+def _draw_countplot(viz, title, col=None, color=None, **_):
+    if col not in viz._column_kinds()['categorical']:
+        viz._validate_categorical_column(col)  # raises the specific error
+    # One hash count in pandas instead of seaborn's per-row category inference.
+    # sort=False keeps seaborn's order: first appearance, or the categories' order.
+    counts = viz.df[col].value_counts(sort=False)
+    fig = viz._reusable_figure()
+    ax = fig.add_subplot()
+    ax.bar(counts.index.astype(str), counts.to_numpy(), color=color or 'C0')
+    ax.set_xlabel(col)
+    ax.set_ylabel('count')
+    ax.set_title(title)
+    return fig
+
+
+def _draw_boxplot(viz, title, col=None, color=None, **_):
+    viz._validated(('numeric', col), lambda: viz._validate_numeric_column(col))
+    fig = viz._reusable_figure()
+    ax = fig.add_subplot()
+    _boxplot(ax, viz.df[col].to_numpy(dtype=np.float64, na_value=np.nan), color=color)
+    ax.set_xlabel(col)
+    ax.set_title(title)
+    return fig
+
+
+def _draw_pairplot(viz, title, data=None, diag='hist', **_):
+    if data is None or data.empty:
+        raise ValueError("Data must not be empty for a pairplot.")
+    viz._validate_numeric_dataframe(data)
+    viz._validate_diag_kind(diag)
+    fig = viz._scatter_matrix(data, diag)
+    fig.suptitle(title)
+    return fig
+
+
+# DataVisualizer.helper_plot dispatch: plot_type -> function drawing the plot and returning its figure.
+PLOT_HANDLERS = {
+    'heatmap': _draw_heatmap,
+    'countplot': _draw_countplot,
+    'boxplot': _draw_boxplot,
+    'pairplot': _draw_pairplot,
+}
+
 
 class DataVisualizer(BaseValidator):
-    def __init__(self, df):
+    def __init__(self, df, df_version=0, use_gpu=False, image_format='png', dpi=150):
         self.df = df
+        self.df_version = df_version
+        # Output resolution; encode time grows with the pixel count (dpi squared).
+        self.dpi = dpi
+        # Format of in-memory images ('png' or 'jpg'); saved files follow their extension.
+        self.image_format = image_format
+        # Compute large correlation matrices with CuPy when a CUDA device is available.
+        self.use_gpu = use_gpu
+        # Derived data (correlation matrix, missing-value mask) reused until df changes.
+        self._cache = {}
+        self._cache_key = None
+        self._cache_ref = None
+        # Figure reused by the single-axes plots (heatmap, countplot, boxplot); not tracked by pyplot.
+        self._figure = None
+        # Background image writers and their pending writes, created on first use.
+        self._io_pool = None
+        self._pending_writes = []
+
+    def rebind(self, df, df_version):
+        """
+        Point the visualizer at the current DataFrame.
+
+        Cached derived data is kept only if both the DataFrame object and its
+        version are unchanged.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to visualize.
+        df_version : int
+            Caller-maintained counter, bumped whenever df is mutated.
+        """
+        if df is not self.df or df_version != self.df_version:
+            self.reset_cache()
+        self.df = df
+        self.df_version = df_version
+
+    def reset_cache(self):
+        """Drop cached derived data; call after mutating self.df in place."""
+        self._cache = {}
+        self._cache_key = None
+        self._cache_ref = None
+
+    def _fingerprint(self):
+        """Cheap signature of self.df: version, shape, column labels and dtypes."""
+        df = self.df
+        return (self.df_version, df.shape, tuple(df.columns), tuple(df.dtypes))
+
+    def _cached(self, key, compute):
+        """
+        Return self._cache[key], computing and storing it on first use.
+
+        The cache is dropped whenever self.df is a different object or its fingerprint
+        changes, so plots stay correct even if df is swapped or reshaped without
+        rebind(). Identity is checked through a weakref rather than id(), which a new
+        frame can reuse once the old one is garbage collected.
+        """
+        fingerprint = self._fingerprint()
+        cached_df = self._cache_ref() if self._cache_ref is not None else None
+        if fingerprint != self._cache_key or cached_df is not self.df:
+            self._cache = {}
+            self._cache_key = fingerprint
+            self._cache_ref = weakref.ref(self.df)
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _validated(self, key, check):
+        """
+        Run a validator once per DataFrame fingerprint.
+
+        Passing checks are remembered in the derived-data cache, so they are dropped
+        together with it whenever self.df changes. Failing checks raise and are not stored.
+        """
+        def run():
+            check()
+            return True
+
+        self._cached(('validated', key), run)
+
+    def _column_kinds(self):
+        """
+        Column names of self.df by kind, as frozensets for O(1) membership checks.
+
+        'number' matches df.select_dtypes(include='number'); 'categorical' is object and
+        category columns. Built once per DataFrame fingerprint.
+        """
+        return self._cached('column_kinds', lambda: {
+            'number': frozenset(get_numeric_columns(self.df)),
+            'categorical': frozenset(get_categorical_columns(self.df)),
+        })
+
+    @property
+    def numeric_frame(self):
+        """
+        self.df restricted to its numeric columns, as df.select_dtypes(include='number').
+
+        Built once per DataFrame fingerprint and shared by the plots that need it. The
+        fingerprint cannot see in-place value edits; call reset_cache() after those.
+        """
+        return self._cached('numeric_frame', lambda: self.df.loc[:, [
+            col in self._column_kinds()['number'] for col in self.df.columns
+        ]])
+
+    def _numeric_data(self):
+        """Columns DataFrame.corr(numeric_only=True) would use: numeric and bool."""
+        return self.df.loc[:, [is_numeric_dtype(dtype) for dtype in self.df.dtypes]]
 
     def helper_plot(
             self,
             plot_type,
             title,
-            file_path,
+            file_path=None,
             diag='hist',
             data=None,
             col=None,
@@ -23,7 +284,7 @@ class DataVisualizer(BaseValidator):
             color=None
     ):
         """
-        Generic helper to generate and save different Seaborn plots.
+        Generic helper to generate and save different plots.
 
         Parameters
         ----------
@@ -31,8 +292,9 @@ class DataVisualizer(BaseValidator):
             Type of plot to generate ('heatmap', 'countplot', 'boxplot', 'pairplot').
         title : str
             Title for the plot.
-        file_path : str
-            Path to save the generated plot image.
+        file_path : str, optional
+            Path to save the generated plot image. If None, the image is
+            rendered to an in-memory PNG buffer instead.
         diag : str, optional
             Type of diagonal plot for pairplot ('hist' or 'kde'), by default 'hist'.
         data : pd.DataFrame, optional
@@ -41,75 +303,249 @@ class DataVisualizer(BaseValidator):
             Column name (required for 'countplot' or 'boxplot').
         cbar, yticklabels, annot, color : various, optional
             Plot customization parameters.
+
+        Returns
+        -------
+        BytesIO or None
+            Image buffer (self.image_format) positioned at the start when file_path
+            is None, otherwise None.
         """
 
-        # VALIDATIONS
-        self._validate_dataframe()
-        self._validate_plot_type(plot_type, ['heatmap', 'countplot', 'boxplot', 'pairplot'])
+        # VALIDATIONS (memoized until self.df changes)
+        self._validated('dataframe', self._validate_dataframe)
+        _load_backend()
+        self._validate_plot_type(plot_type, list(PLOT_HANDLERS))
 
         # Directory check
-        dir_name = os.path.dirname(file_path)
-        if dir_name:
-            os.makedirs(dir_name, exist_ok=True)
+        if file_path is not None:
+            dir_name = os.path.dirname(file_path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
 
         # PLOT LOGIC
-        plt.figure(figsize=(8, 5))
-
-        if plot_type == 'heatmap':
-            if data is None or data.empty:
-                raise ValueError("Data must not be empty for a heatmap.")
-            self._validate_numeric_dataframe(data)
-            sns.heatmap(data, annot=annot, cbar=cbar, yticklabels=yticklabels)
-
-        elif plot_type == 'countplot':
-            self._validate_column_exists(col)
-            self._validate_categorical_column(col)
-            sns.countplot(x=self.df[col], color=color)
-
-        elif plot_type == 'boxplot':
-            self._validate_column_exists(col)
-            self._validate_numeric_column(col)
-            sns.boxplot(x=self.df[col], color=color)
-
-        else:  # pairplot
-            if data is None or data.empty:
-                raise ValueError("Data must not be empty for a pairplot.")
-            self._validate_numeric_dataframe(data)
-            self._validate_diag_kind(diag)
-            sns.pairplot(data, diag_kind=diag)
+        fig = PLOT_HANDLERS[plot_type](
+            self, title, data=data, col=col, diag=diag,
+            cbar=cbar, yticklabels=yticklabels, annot=annot, color=color
+        )
 
         # finally
-        plt.title(title)
-        plt.tight_layout()
-        plt.savefig(file_path, dpi=300)
-        plt.close()
+        fig.tight_layout()
+        if file_path is None:
+            buffer = BytesIO()
+            fig.savefig(buffer, format=self.image_format, dpi=self.dpi, **self._save_kwargs(self.image_format))
+            buffer.seek(0)
+            return buffer
+
+        extension = os.path.splitext(file_path)[1].lstrip('.').lower()
+        if extension in SAVE_PIL_KWARGS:
+            # Rasterize here (matplotlib is not thread-safe), encode on a worker thread.
+            fig.set_dpi(self.dpi)
+            fig.canvas.draw()
+            rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+            self._submit_write(file_path, rgba, extension, self.dpi)
+            return
+
+        fig.savefig(file_path, dpi=self.dpi, **self._save_kwargs(extension or 'png'))
+
+    def _reusable_figure(self):
+        """
+        Return the shared 8x5 figure, cleared, creating it on first use.
+
+        Clearing a figure is much cheaper than building a new one (backend canvas,
+        font lookups) for every plot.
+        """
+        if self._figure is None:
+            self._figure = _new_figure(figsize=(8, 5))
+        else:
+            self._figure.clear()
+            # clear() keeps the margins the last tight_layout() set; restore the defaults
+            # so colorbars and layout come out exactly as on a fresh figure.
+            self._figure.subplotpars.update(*(
+                matplotlib.rcParams[f'figure.subplot.{side}']
+                for side in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+            ))
+            # Saving to a file path raises the figure dpi for rasterizing; start from the default.
+            self._figure.set_dpi(matplotlib.rcParams['figure.dpi'])
+        return self._figure
+
+    def close(self):
+        """
+        Finish pending writes, shut down the writer threads and drop the shared figure.
+
+        Re-raises the first error a background write hit, after cleaning up.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+            self._figure = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def _submit_write(self, file_path, rgba, image_format, dpi):
+        """Queue an image write on the background pool."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix='plot-writer')
+        self._pending_writes = [future for future in self._pending_writes if not future.done()]
+        self._pending_writes.append(self._io_pool.submit(_write_image, file_path, rgba, image_format, dpi))
+
+    def flush(self):
+        """
+        Wait until every plot saved to a PNG/JPEG path has been written.
+
+        Files are encoded in the background, so call this before reading them back.
+        Re-raises the first error a write hit.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+
+    @staticmethod
+    def _save_kwargs(image_format):
+        """Extra savefig arguments for image_format (fast Pillow encoder settings)."""
+        kwargs = {}
+        pil_kwargs = SAVE_PIL_KWARGS.get(image_format)
+        if pil_kwargs:
+            kwargs['pil_kwargs'] = dict(pil_kwargs)
+        if image_format == 'png':
+            # Skip matplotlib's default 'Software' text chunk.
+            kwargs['metadata'] = {'Software': None}
+        return kwargs
+
+    @staticmethod
+    def _scatter_matrix(data, diag='hist'):
+        """
+        Draw a pairplot-style scatter matrix of data's columns on one grid of Axes.
+
+        Plain matplotlib instead of sns.pairplot: no FacetGrid, no per-axes DataFrame
+        lookups, and rasterized scatters so many points don't bloat vector output.
+        Histograms (or KDE curves) go on the diagonal.
+        """
+        columns = list(data.columns)
+        arr = data.to_numpy(dtype=np.float32, na_value=np.nan)
+        k = len(columns)
+        fig = _new_figure(figsize=(2.5 * k, 2.5 * k))
+        axes = fig.subplots(k, k, squeeze=False)
+
+        for i in range(k):
+            for j in range(k):
+                ax = axes[i, j]
+                if i == j:
+                    values = arr[:, i][~np.isnan(arr[:, i])]
+                    if diag == 'kde' and values.size > 1 and values.min() < values.max():
+                        grid = np.linspace(values.min(), values.max(), 200)
+                        ax.plot(grid, gaussian_kde(values)(grid))
+                    else:
+                        ax.hist(values, bins=30)
+                else:
+                    # NaN points are skipped by scatter.
+                    ax.scatter(arr[:, j], arr[:, i], s=2, linewidths=0, rasterized=True)
 
-    def plot_missing_heatmap(self, file_path):
+                ax.tick_params(labelsize=7)
+                if i == k - 1:
+                    ax.set_xlabel(columns[j])
+                if j == 0:
+                    ax.set_ylabel(columns[i])
+
+        return fig
+
+    def plot_missing_heatmap(self, file_path=None):
         """
-        Plot and save a heatmap showing missing values in the dataset.
+        Plot and save an image of the missing values in the dataset.
+
+        The mask is written straight to an image with matplotlib.image.imsave (no figure,
+        axes or seaborn heatmap): one pixel row per data row, each column stretched to a
+        band, missing cells black. Datasets taller than MAX_HEATMAP_ROWS are binned.
 
         Parameters
         ----------
-        file_path : str
+        file_path : str, optional
             Path (including filename) where the heatmap image will be saved.
+            If None, the image is returned as an in-memory buffer (self.image_format).
 
         Returns
         -------
-        None
+        BytesIO or None
+        """
+        self._validated('dataframe', self._validate_dataframe)
+        mask = self._cached('missing_mask', self._missing_mask)
+        _load_backend()
+
+        n_rows, n_cols = mask.shape
+        if n_rows > MAX_HEATMAP_ROWS:
+            # Each drawn row is a block of consecutive rows, marked missing if any row in it is.
+            starts = np.linspace(0, n_rows, MAX_HEATMAP_ROWS, endpoint=False).astype(np.int64)
+            mask = np.maximum.reduceat(mask, starts, axis=0)
+        # Stretch each column to a band so the image is not a few pixels wide.
+        band = max(1, round(mask.shape[0] * MISSING_IMAGE_ASPECT / max(n_cols, 1)))
+        image = np.repeat(mask, band, axis=1)
+
+        if file_path is None:
+            target, image_format = BytesIO(), self.image_format
+        else:
+            dir_name = os.path.dirname(file_path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+            target = file_path
+            image_format = os.path.splitext(file_path)[1].lstrip('.').lower() or 'png'
+
+        mpimg.imsave(
+            target, image, cmap='gray_r', vmin=0, vmax=1, format=image_format, dpi=self.dpi,
+            pil_kwargs=dict(SAVE_PIL_KWARGS.get(image_format, {})) or None,
+        )
+        if file_path is None:
+            target.seek(0)
+            return target
+
+    def _missing_mask(self):
+        """
+        Missing-value mask of self.df as a (rows, cols) uint8 array, 1 where missing.
+
+        Columns are grouped by kind and each group is tested in one numpy call:
+        np.isnan for float columns, all zeros for int/bool columns (they cannot hold
+        NaN), pd.isna for the rest. An all-float frame is a single np.isnan call.
+        """
+        kinds = [dtype.kind if isinstance(dtype, np.dtype) else 'O' for dtype in self.df.dtypes]
+        if kinds and all(kind in 'fc' for kind in kinds):
+            # Homogeneous float data: one isnan over the block, bool viewed as uint8.
+            return np.isnan(self.df.to_numpy()).view(np.uint8)
+
+        mask = np.zeros(self.df.shape, dtype=np.uint8, order='F')
+        floats = [position for position, kind in enumerate(kinds) if kind in 'fc']
+        others = [position for position, kind in enumerate(kinds) if kind not in 'fciub']
+        if floats:
+            mask[:, floats] = np.isnan(self.df.iloc[:, floats].to_numpy())
+        if others:
+            mask[:, others] = pd.isna(self.df.iloc[:, others].to_numpy())
+        return mask
+
+    def plot_correlation_heatmap(self, file_path=None):
         """
+        Plot a heatmap of the correlations between numeric columns.
 
-        self.helper_plot('heatmap', "Missing Values Heatmap", file_path, data=self.df.isnull(), cbar=False, yticklabels=False)
+        Returns None, with a warning, when there are fewer than two numeric columns,
+        since such a heatmap carries no information.
+        """
+        if sum(is_numeric_dtype(dtype) for dtype in self.df.dtypes) < 2:
+            warnings.warn("Need at least two numeric columns to plot a correlation heatmap.", stacklevel=2)
+            return None
 
-    def plot_correlation_heatmap(self, file_path):
-        self.helper_plot('heatmap', "Correlation Heatmap", file_path, data=self.df.corr(numeric_only=True), annot=True)
+        corr = self._cached('corr', lambda: correlation(self._numeric_data(), use_gpu=self.use_gpu))
+        return self.helper_plot('heatmap', "Correlation Heatmap", file_path, data=corr, annot=True)
 
-    def plot_value_counts(self, col, file_path):
-        self.helper_plot('countplot', f"Value Counts for {col}", file_path, col=col)
+    def plot_value_counts(self, col, file_path=None):
+        return self.helper_plot('countplot', f"Value Counts for {col}", file_path, col=col)
 
-    def plot_outliers(self, col, file_path):
-        if col not in self.df.select_dtypes(include='number').columns.to_list():
+    def plot_outliers(self, col, file_path=None):
+        if col not in self._column_kinds()['number']:
             raise TypeError("column must be of numeric data type.")
-        self.helper_plot(
+        return self.helper_plot(
             plot_type='boxplot',
             title=f"Outlier Distribution - {col}",
             file_path=file_path,
@@ -117,19 +553,68 @@ class DataVisualizer(BaseValidator):
             color='skyblue'
         )
 
-    def pairplot_numeric(self, file_path, subset=None):
+    def plot_outliers_all(self, out_dir, max_workers=None):
+        """
+        Save an outlier boxplot for every numeric column into out_dir, in parallel.
+
+        Each column is drawn in a worker process that receives only that column's values
+        as a float array, so the whole DataFrame is never pickled. Uses plain matplotlib
+        boxplots; timedelta columns are skipped. Workers are spawned rather than forked,
+        since the caller may already run threads (Streamlit, numba), so scripts calling
+        this must guard their entry point with if __name__ == '__main__'.
+
+        Parameters
+        ----------
+        out_dir : str
+            Directory for the images, created if needed. Files are named
+            outliers_<column>.<image_format>, with _<column position> appended when two
+            column names sanitize to the same file name.
+        max_workers : int, optional
+            Number of worker processes, by default one per CPU.
+
+        Returns
+        -------
+        dict
+            Column name -> path of the saved image.
+        """
+        self._validated('dataframe', self._validate_dataframe)
+        os.makedirs(out_dir, exist_ok=True)
+
+        frame = self.numeric_frame
+        jobs = {}
+        used_names = set()
+        for position, (col, dtype) in enumerate(frame.dtypes.items()):
+            if getattr(dtype, 'kind', None) == 'm':
+                continue
+            stem = f"outliers_{_UNSAFE_FILENAME_CHARS.sub('_', str(col))}"
+            while stem.lower() in used_names:  # lower(): case-insensitive file systems
+                stem = f"{stem}_{position}"
+            used_names.add(stem.lower())
+            file_path = os.path.join(out_dir, f"{stem}.{self.image_format}")
+            values = frame.iloc[:, position].to_numpy(dtype=np.float64, na_value=np.nan)
+            jobs[col] = (f"Outlier Distribution - {col}", values, file_path, self.dpi)
+        if not jobs:
+            return {}
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            futures = {col: pool.submit(_save_outlier_plot, *job) for col, job in jobs.items()}
+            return {col: future.result() for col, future in futures.items()}
+
+    def pairplot_numeric(self, file_path=None, subset=None):
         if subset is not None:
             missing_cols = [col for col in subset if col not in self.df.columns]
             if missing_cols:
                 raise ValueError(f"These columns are not in the DataFrame: {missing_cols}")
-            numeric_cols = self.df[subset].select_dtypes(include='number')
+            number = self._column_kinds()['number']
+            numeric_cols = self.numeric_frame[[col for col in subset if col in number]]
         else:
-            numeric_cols = self.df.select_dtypes(include='number')
+            numeric_cols = self.numeric_frame
 
         if numeric_cols.shape[1] < 2:
             raise ValueError("Need at least two numeric columns to create a pairplot.")
 
-        self.helper_plot(
+        return self.helper_plot(
             plot_type='pairplot',
             title="PairPlot of Numeric Columns",
             file_path=file_path,
@@ -17,4 +17,5 @@ dc.handle_missing(col_name='Age', strategy='median', fill_value=None).remove_dup
 #
 dv = DataVisualizer(df)
 dv.plot_correlation_heatmap(file_path='outputs/plots/correlation.png')
+dv.flush()
 dc.save_cleaned('outputs/cleaned_data.csv')
\ No newline at end of file
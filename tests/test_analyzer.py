@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.analyzer as analyzer_module
+from core.analyzer import DataAnalyzer
+
+
+def _mixed_frame(n=20_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'category': pd.Categorical([f'category value number {i}' for i in rng.integers(0, 5_000, n)]),
+        'object': [f'str{i}' for i in range(n)],
+        'string': pd.array([f'x{i}' for i in range(n)], dtype='string'),
+        'float': rng.random(n),
+        'int': np.arange(n),
+    })
+
+
+MEMORY_FRAMES = {
+    'mixed': _mixed_frame(),
+    'category_heavy': pd.DataFrame({
+        'c': pd.Categorical([f'a fairly long category label {i}' for i in range(3_000)] * 2),
+    }),
+    'numeric': pd.DataFrame({'f': np.ones(1_000), 'i': np.arange(1_000)}),
+}
+
+
+@pytest.mark.parametrize('name', MEMORY_FRAMES)
+def test_memory_estimate_close_to_exact(name):
+    df = MEMORY_FRAMES[name]
+    exact = df.memory_usage(deep=True).sum()
+    assert DataAnalyzer(df)._estimate_memory() == pytest.approx(exact, rel=0.05)
+
+
+def test_basic_info_memory_marks_estimate():
+    df = MEMORY_FRAMES['category_heavy']
+    exact_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+    info = DataAnalyzer(df).basic_info()
+    assert info['memory'].startswith('~')
+    assert float(info['memory'][1:].split()[0]) == pytest.approx(exact_mb, rel=0.05)
+    assert DataAnalyzer(df).basic_info(accurate=True)['memory'] == f"{exact_mb:.2f} MB"
+
+
+def test_report_refreshes_after_in_place_astype():
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'x']})
+    analyzer = DataAnalyzer(df)
+    assert analyzer.generate_report()['basic_info']['dtypes']['a'] == 'int64'
+    df['a'] = df['a'].astype('float64')
+    assert analyzer.generate_report()['basic_info']['dtypes']['a'] == 'float64'
+
+
+def test_memos_do_not_serve_a_replaced_frame_with_the_same_structure():
+    analyzer = DataAnalyzer(pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'x']}))
+    assert analyzer.generate_report()['duplicate_summary']['duplicate_rows'] == 0
+    analyzer.basic_info(accurate=True)
+    # Same shape, labels, dtypes and df_version; the old frame is freed, so its id may be reused.
+    analyzer.df = pd.DataFrame({'a': [1, 1, 1], 'b': ['a long string value' * 50] * 3})
+    assert analyzer.generate_report()['duplicate_summary']['duplicate_rows'] == 2
+    analyzer.basic_info(accurate=True)
+    assert analyzer._mem_cache[2] == analyzer.df.memory_usage(deep=True).sum()
+
+
+DUPLICATE_FRAMES = {
+    'signed_zero': pd.DataFrame({'f': [0.0, -0.0, 1.0, -0.0], 'i': [1, 1, 2, 1]}),
+    'nan_rows': pd.DataFrame({'f': [np.nan, np.nan, 1.0, np.nan], 's': [None, None, 'a', 'b']}),
+    'mixed': pd.DataFrame({
+        'c': pd.Categorical(['x', 'y', 'x', 'x', None, None]),
+        'o': ['a', 'b', 'a', 'a', 'c', 'c'],
+        'b': [True, False, True, True, False, False],
+        'd': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-01', None, None]),
+    }),
+    'random_ints': pd.DataFrame(np.random.default_rng(0).integers(0, 3, (2_000, 3)), columns=list('abc')),
+}
+
+
+@pytest.mark.parametrize('exact_limit', [100_000, 0], ids=['exact', 'hashed'])
+@pytest.mark.parametrize('name', DUPLICATE_FRAMES)
+def test_duplicate_count_matches_pandas(name, exact_limit, monkeypatch):
+    monkeypatch.setattr(analyzer_module, 'EXACT_DUPLICATE_CHECK_ROWS', exact_limit)
+    df = DUPLICATE_FRAMES[name]
+    expected = int(df.duplicated().sum())
+    assert DataAnalyzer(df).duplicate_summary() == {'duplicate_rows': expected}
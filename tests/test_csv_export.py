@@ -0,0 +1,67 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.cleaner import DataCleaner
+from core.utils import to_csv_bytes, write_csv
+
+
+def _written(df):
+    buffer = BytesIO()
+    write_csv(df, buffer)
+    return buffer.getvalue()
+
+
+FRAMES = {
+    'mixed': pd.DataFrame({
+        'i': [1, 2, 3],
+        'f': [1.0, np.nan, 2.5],
+        'f32': np.array([7.1, 0, 1], dtype=np.float32),
+        'b': [True, False, True],
+        'c': pd.Categorical(['x', None, 'y']),
+        'I': pd.array([1, None, 3], dtype='Int64'),
+        'o': ['a', None, ''],
+        'a b': [1, 2, 3],
+    }),
+    'quoted_strings': pd.DataFrame({'name': ['Braund, Mr. Owen', 'say "hi"'], 'n': [1, 2]}),
+    'datetimes': pd.DataFrame({'t': pd.to_timedelta(['1h', '2h']), 'd': pd.to_datetime(['2020-01-01', None])}),
+    'single_categorical': pd.DataFrame({'c': pd.Categorical(['x', None, 'y', None])}),
+    'single_int64': pd.DataFrame({'I': pd.array([1, None, 3], dtype='Int64')}),
+    'single_float': pd.DataFrame({'f': [1.5, np.nan, 2.0]}),
+    'single_empty_string': pd.DataFrame({'s': ['a', '', None]}),
+    'none_label': pd.DataFrame({None: [1, 2], 'x': [3, 4]}),
+    'int_labels': pd.DataFrame({0: [1, 2], 1: [3, 4]}),
+    'no_columns': pd.DataFrame(index=range(3)),
+    'no_rows': pd.DataFrame({'a': pd.Series([], dtype=float), 'b': pd.Series([], dtype=object)}),
+}
+
+
+@pytest.mark.parametrize('name', FRAMES)
+def test_write_csv_matches_to_csv(name):
+    df = FRAMES[name]
+    assert _written(df) == df.to_csv(index=False).encode('utf-8')
+
+
+@pytest.mark.parametrize('name', ['single_categorical', 'single_int64', 'single_float', 'single_empty_string'])
+def test_single_column_missing_values_keep_their_rows(name):
+    df = FRAMES[name]
+    assert len(pd.read_csv(BytesIO(_written(df)))) == len(df)
+
+
+def test_save_cleaned_round_trip(tmp_path):
+    df = pd.DataFrame({'c': pd.Categorical(['x', None, 'y', None])})
+    path = tmp_path / 'cleaned.csv'
+    DataCleaner(df).save_cleaned(str(path))
+    assert path.read_bytes() == df.to_csv(index=False).encode('utf-8')
+    assert len(pd.read_csv(path)) == 4
+
+
+@pytest.mark.parametrize('name', FRAMES)
+def test_download_bytes_round_trip(name):
+    df = FRAMES[name]
+    data = to_csv_bytes(df)
+    assert data == df.to_csv(index=False).encode('utf-8')
+    if df.shape[1]:
+        assert len(pd.read_csv(BytesIO(data))) == len(df)
@@ -0,0 +1,43 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from core.utils import load_file
+
+
+def _loaded(data, tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(data)
+    return load_file(str(path), optimize=False)
+
+
+CSV_FILES = {
+    'plain': b'a,b,c\n1,2.5,x\n3,,y\n',
+    'duplicate_headers': b'a,a,b\n1,2,3\n4,5,6\n',
+    'dates_and_times': b'd,t,ts\n2020-01-01,12:30:00,2020-01-01 10:00:00\n2021-02-02,13:00:00,2021-02-02 11:00:00\n',
+    'big_integers': b'u,i\n18446744073709551615,1\n9223372036854775808,2\n',
+    'ragged_rows': b'a,b\n1,2\n3\n',
+}
+
+
+@pytest.mark.parametrize('name', CSV_FILES)
+def test_load_file_matches_c_engine(name, tmp_path):
+    data = CSV_FILES[name]
+    pd.testing.assert_frame_equal(_loaded(data, tmp_path), pd.read_csv(BytesIO(data)))
+
+
+def test_duplicate_headers_are_renamed(tmp_path):
+    assert _loaded(CSV_FILES['duplicate_headers'], tmp_path).columns.tolist() == ['a', 'a.1', 'b']
+
+
+def test_invalid_utf8_is_rejected(tmp_path, capsys):
+    assert _loaded(b'a,s\n1,\xff\xfe\n', tmp_path) is None
+    assert "can't decode" in capsys.readouterr().out
+
+
+def test_uploaded_and_path_loads_agree(tmp_path):
+    data = CSV_FILES['plain']
+    upload = BytesIO(data)
+    upload.name = 'data.csv'
+    pd.testing.assert_frame_equal(load_file(upload, optimize=False), _loaded(data, tmp_path))
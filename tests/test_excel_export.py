@@ -0,0 +1,34 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.utils import to_excel_bytes
+
+
+def _baseline_bytes(df):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, index=False, sheet_name='Sheet1')
+    return output.getvalue()
+
+
+FRAMES = {
+    'mixed': pd.DataFrame({
+        'i': [1, 2, 3],
+        'f': [1.5, np.nan, -2.0],
+        's': ['a', None, 'c'],
+        'b': [True, False, True],
+        'd': pd.to_datetime(['2020-01-01 00:00', None, '2021-06-30 12:00']),
+    }),
+    'infinities': pd.DataFrame({'f': [np.inf, -np.inf, 1.0, np.nan], 'f32': np.float32([np.inf, 0, -np.inf, 2])}),
+}
+
+
+@pytest.mark.parametrize('name', FRAMES)
+def test_excel_bytes_read_back_like_to_excel(name):
+    df = FRAMES[name]
+    ours = pd.read_excel(BytesIO(to_excel_bytes(df)))
+    baseline = pd.read_excel(BytesIO(_baseline_bytes(df)))
+    pd.testing.assert_frame_equal(ours, baseline)
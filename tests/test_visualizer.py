@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.visualizer as visualizer
+from core.visualizer import DataVisualizer
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'a': rng.random(50), 'b': rng.random(50), 'c': ['x', 'y'] * 25})
+
+
+def test_close_writes_files_and_stops_writer_threads(tmp_path):
+    with DataVisualizer(_frame()) as viz:
+        viz.plot_correlation_heatmap(str(tmp_path / 'corr.png'))
+    assert (tmp_path / 'corr.png').stat().st_size > 0
+    assert viz._io_pool is None
+
+
+def test_close_reraises_failed_background_write(tmp_path, monkeypatch):
+    def failing_write(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(visualizer, '_write_image', failing_write)
+    viz = DataVisualizer(_frame())
+    viz.plot_correlation_heatmap(str(tmp_path / 'corr.png'))
+    with pytest.raises(OSError, match="disk full"):
+        viz.close()
+    assert viz._io_pool is None
+
+
+def test_derived_cache_does_not_serve_a_replaced_frame_with_the_same_structure():
+    viz = DataVisualizer(_frame())
+    viz.numeric_frame
+    # Same shape, labels, dtypes and df_version; the old frame is freed, so its id may be reused.
+    viz.df = _frame().assign(a=0.5)
+    pd.testing.assert_frame_equal(viz.numeric_frame, viz.df[['a', 'b']])